@@ -0,0 +1,64 @@
+"""Benchmark of JSON codecs on large bulk writes.
+
+Creates documents with a mock transport, so that only client-side work is measured:
+encoding of request bodies, sending through httpx2 and decoding of responses.
+
+Run with `uv run --extra orjson python benchmarks/json_codec_benchmark.py`.
+"""
+
+import time
+
+import httpx2
+
+from strapi_client import StrapiClient
+from strapi_client.json_codec import JsonCodec, OrjsonCodec, StdlibJsonCodec
+
+DOCUMENTS_COUNT = 2000
+PARAGRAPHS_COUNT = 50
+
+
+def handler(request: httpx2.Request) -> httpx2.Response:
+    return httpx2.Response(200, content=request.content, headers={"Content-Type": "application/json"})
+
+
+def make_documents() -> list[dict]:
+    return [
+        {
+            "title": f"Document {i}",
+            "rating": i / 7,
+            "tags": [f"tag-{j}" for j in range(20)],
+            "content": [
+                {"type": "paragraph", "text": f"Paragraph {j} of document {i} " * 10} for j in range(PARAGRAPHS_COUNT)
+            ],
+        }
+        for i in range(DOCUMENTS_COUNT)
+    ]
+
+
+def run(codec: JsonCodec, documents: list[dict]) -> float:
+    with StrapiClient(
+        base_url="http://test", token="token", transport=httpx2.MockTransport(handler), json_codec=codec
+    ) as client:
+        started_at = time.perf_counter()
+        result = client.create_documents("items", documents, max_concurrency=1)
+        elapsed = time.perf_counter() - started_at
+    assert result.success
+    return elapsed
+
+
+def main() -> None:
+    documents = make_documents()
+    codecs: list[JsonCodec] = [StdlibJsonCodec()]
+    try:
+        codecs.append(OrjsonCodec())
+    except ImportError:
+        print("orjson is not installed, only standard library codec is measured")
+    baseline = None
+    for codec in codecs:
+        elapsed = min(run(codec, documents) for _ in range(3))
+        baseline = baseline or elapsed
+        print(f"{type(codec).__name__:>16}: {elapsed:.3f}s for {DOCUMENTS_COUNT} documents, x{baseline / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,45 @@
+from strapi_client.document_loader import DocumentLoader
 from strapi_client.models.active_document import ActiveDocument, DocumentField
+from strapi_client.models.adaptive_concurrency import AdaptiveConcurrency
 from strapi_client.models.base_component import BaseComponent
 from strapi_client.models.base_document import BaseDocument
+from strapi_client.models.bulk_result import BulkItemResult, BulkResult
+from strapi_client.models.cooperative_validation import CooperativeValidation
+from strapi_client.models.lazy_document_list import LazyDocumentList
 from strapi_client.models.media_image_document import MediaImageDocument
+from strapi_client.models.query_plan import QueryPlan
+from strapi_client.models.rate_limit import RateLimit
 from strapi_client.models.response import DocumentResponse, DocumentsResponse, ResponseMeta
+from strapi_client.models.retry_policy import RetryPolicy
 from strapi_client.models.single_smart_document import SingleSmartDocument
 from strapi_client.models.smart_document import SmartDocument
 from strapi_client.models.webhook_payload import WebhookPayload
+from strapi_client.response_cache import MemoryCache, ResponseCache
+from strapi_client.sqlite_cache import SQLiteCache
 from strapi_client.strapi_client import StrapiClient
 from strapi_client.strapi_client_async import StrapiClientAsync
 
 __all__ = [
     "ActiveDocument",
+    "AdaptiveConcurrency",
     "BaseComponent",
     "BaseDocument",
+    "BulkItemResult",
+    "BulkResult",
+    "CooperativeValidation",
     "DocumentField",
+    "DocumentLoader",
     "DocumentResponse",
     "DocumentsResponse",
+    "LazyDocumentList",
     "MediaImageDocument",
+    "MemoryCache",
+    "QueryPlan",
+    "RateLimit",
+    "ResponseCache",
     "ResponseMeta",
+    "RetryPolicy",
+    "SQLiteCache",
     "SingleSmartDocument",
     "SmartDocument",
     "StrapiClient",
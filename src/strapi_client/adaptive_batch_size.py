@@ -0,0 +1,63 @@
+class AdaptiveBatchSize:
+    """Page size controller for batch requests.
+
+    Grows page size while time per document decreases and shrinks it back when time per document increases.
+    Page size never exceeds the limit detected from the server response and keeps responses under
+    `max_page_bytes`.
+    """
+
+    batch_size: int
+    min_size: int
+    max_size: int
+    max_page_bytes: int
+    growth_factor: float
+    tolerance: float
+    _best_time_per_document: float | None = None
+
+    def __init__(
+        self,
+        initial_size: int = 25,
+        min_size: int = 10,
+        max_size: int = 1000,
+        max_page_bytes: int = 8 * 1024 * 1024,
+        growth_factor: float = 2.0,
+        tolerance: float = 0.1,
+    ) -> None:
+        if not 1 <= min_size <= initial_size <= max_size:
+            raise ValueError("Batch sizes must satisfy 1 <= min_size <= initial_size <= max_size")
+        if growth_factor <= 1:
+            raise ValueError("growth_factor must be greater than 1")
+        self.batch_size = initial_size
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_page_bytes = max_page_bytes
+        self.growth_factor = growth_factor
+        self.tolerance = tolerance
+
+    def record(self, documents_count: int, content_length: int, elapsed: float, server_limit: int | None) -> None:
+        """Update page size after a page is received.
+
+        Args:
+            documents_count: Number of documents in the received page.
+            content_length: Size of the response body in bytes.
+            elapsed: Time spent to request and parse the page in seconds.
+            server_limit: Page limit reported by the server in `meta.pagination.limit`.
+        """
+        requested_size = self.batch_size
+        if server_limit is not None and server_limit < requested_size:
+            # Server clamped requested limit to its maxLimit, so there is no reason to request more
+            self.max_size = max(server_limit, 1)
+            self.min_size = min(self.min_size, self.max_size)
+        if documents_count < min(requested_size, self.max_size):  # Short page is the last one
+            self.batch_size = min(self.batch_size, self.max_size)
+            return
+        time_per_document = elapsed / documents_count
+        if self._best_time_per_document is None or time_per_document < self._best_time_per_document:
+            self._best_time_per_document = time_per_document
+            next_size = int(requested_size * self.growth_factor)
+        elif time_per_document > self._best_time_per_document * (1 + self.tolerance):
+            next_size = int(requested_size / self.growth_factor)
+        else:
+            next_size = requested_size
+        max_size_by_bytes = int(self.max_page_bytes * documents_count / max(content_length, 1))
+        self.batch_size = max(self.min_size, min(next_size, self.max_size, max_size_by_bytes))
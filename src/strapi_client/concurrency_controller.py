@@ -0,0 +1,78 @@
+import asyncio
+import math
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from strapi_client.models.adaptive_concurrency import AdaptiveConcurrency
+
+
+class ConcurrencyController:
+    """Additive increase / multiplicative decrease (AIMD) limiter of concurrent requests."""
+
+    config: AdaptiveConcurrency
+    limit: float
+
+    def __init__(self, config: AdaptiveConcurrency) -> None:
+        self.config = config
+        self.limit = float(config.initial_limit)
+        self._in_flight = 0
+        self._latencies: list[float] = []
+        self._decreased_at = 0.0
+        self._condition = asyncio.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[float]:
+        """Wait until the number of requests in flight is under the current limit.
+
+        Yields:
+            float: Time when the slot was acquired, to be passed to `record()`.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        try:
+            yield time.monotonic()
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    async def record(self, started_at: float, failed: bool) -> None:
+        """Update the limit with outcome of a request.
+
+        Args:
+            started_at: Time when the request was started.
+            failed: True if the request was throttled, failed with a server or transport error.
+        """
+        latency = time.monotonic() - started_at
+        if failed:
+            self._decrease(started_at)
+            return
+        self._latencies.append(latency)
+        if len(self._latencies) < self.config.window_size:
+            return
+        latencies = sorted(self._latencies)
+        self._latencies.clear()
+        p95_latency = latencies[math.ceil(0.95 * len(latencies)) - 1]
+        if p95_latency > self.config.target_latency:
+            self._decrease(started_at)
+        else:
+            self._set_limit(self.limit + self.config.increase_step)
+            async with self._condition:
+                self._condition.notify_all()
+
+    def _decrease(self, started_at: float) -> None:
+        # Requests started before the last decrease reflect the previous limit, so they do not cut it again
+        if started_at < self._decreased_at:
+            return
+        self._decreased_at = time.monotonic()
+        self._latencies.clear()
+        self._set_limit(self.limit * self.config.decrease_factor)
+
+    def _set_limit(self, limit: float) -> None:
+        self.limit = min(max(limit, float(self.config.min_limit)), float(self.config.max_limit))
@@ -0,0 +1,148 @@
+import asyncio
+from functools import partial
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote, urljoin
+
+from strapi_client.models.api_parameters import ApiParameters
+from strapi_client.models.query_plan import QueryPlan
+from strapi_client.models.response import DocumentsResponse
+
+if TYPE_CHECKING:
+    from strapi_client.strapi_client_async import StrapiClientAsync
+
+
+class DocumentLoader:
+    """Batched loader of documents by document id.
+
+    Collects `load` calls made within one iteration of the event loop and requests documents of the same
+    collection with `filters[documentId][$in]` queries. Queries are split into chunks of up to `max_batch_size`
+    documents, so that URL of each request does not exceed `max_url_length`.
+    """
+
+    max_batch_size: int
+    max_url_length: int
+
+    def __init__(self, client: "StrapiClientAsync", max_batch_size: int = 100, max_url_length: int = 2048) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be positive")
+        self.max_batch_size = max_batch_size
+        self.max_url_length = max_url_length
+        self._client = client
+        self._queue: dict[tuple[str, str], dict[str, list[asyncio.Future[dict[str, Any] | None]]]] = {}
+        self._params: dict[tuple[str, str], ApiParameters] = {}
+        self._tasks: set[asyncio.Task[DocumentsResponse]] = set()
+        self._scheduled = False
+
+    async def load(
+        self,
+        plural_api_id: str,
+        document_id: str,
+        fields: list[str] | None = None,
+        populate: list[str] | dict[str, Any] | str | None = None,
+        locale: str | None = None,
+        query_plan: QueryPlan | None = None,
+    ) -> dict[str, Any] | None:
+        """Load document by document id together with other documents requested in the same iteration.
+
+        Returns:
+            dict[str, Any] | None: Document data or None if document is not found.
+        """
+        params = ApiParameters(fields=fields, populate=populate, locale=locale).with_query_plan(query_plan)
+        group = (plural_api_id, params.stringify())
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any] | None] = loop.create_future()
+        self._params[group] = params
+        self._queue.setdefault(group, {}).setdefault(document_id, []).append(future)
+        if not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(self._dispatch)
+        return await future
+
+    async def load_many(
+        self,
+        plural_api_id: str,
+        document_ids: list[str],
+        fields: list[str] | None = None,
+        populate: list[str] | dict[str, Any] | str | None = None,
+        locale: str | None = None,
+        query_plan: QueryPlan | None = None,
+    ) -> list[dict[str, Any] | None]:
+        """Load several documents by document ids preserving their order."""
+        return list(
+            await asyncio.gather(
+                *(
+                    self.load(plural_api_id, document_id, fields, populate, locale, query_plan)
+                    for document_id in document_ids
+                )
+            )
+        )
+
+    def _dispatch(self) -> None:
+        queue, params = self._queue, self._params
+        self._queue, self._params, self._scheduled = {}, {}, False
+        for group, futures in queue.items():
+            plural_api_id = group[0]
+            for chunk in self._split(plural_api_id, params[group], list(futures)):
+                task = asyncio.ensure_future(self._load_chunk(plural_api_id, params[group], chunk))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+                task.add_done_callback(partial(self._resolve, {i: futures[i] for i in chunk}))
+
+    def _split(self, plural_api_id: str, params: ApiParameters, document_ids: list[str]) -> list[list[str]]:
+        """Split document ids into chunks fitting into `max_batch_size` and `max_url_length`."""
+        base_params = params.model_copy(update={"start": 0, "limit": self.max_batch_size, "with_count": False})
+        base_length = len(urljoin(self._client.api_url, plural_api_id)) + len(base_params.stringify()) + 1
+        chunks: list[list[str]] = []
+        chunk: list[str] = []
+        length = base_length
+        for document_id in document_ids:
+            if chunk and (
+                len(chunk) >= self.max_batch_size
+                or length + self._get_filter_length(len(chunk), document_id) > self.max_url_length
+            ):
+                chunks.append(chunk)
+                chunk, length = [], base_length
+            length += self._get_filter_length(len(chunk), document_id)
+            chunk.append(document_id)
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    @staticmethod
+    def _get_filter_length(index: int, document_id: str) -> int:
+        """Get length of URL-encoded `&filters[documentId][$in][<index>]=<document_id>`."""
+        return len(f"&filters%5BdocumentId%5D%5B%24in%5D%5B{index}%5D=") + len(quote(document_id, safe=""))
+
+    async def _load_chunk(
+        self, plural_api_id: str, params: ApiParameters, document_ids: list[str]
+    ) -> DocumentsResponse:
+        response = await self._client.get_documents(
+            plural_api_id,
+            filters={"documentId": {"$in": document_ids}},
+            fields=params.fields if isinstance(params.fields, list) else None,
+            populate=params.populate,
+            locale=params.locale,
+            start=0,
+            batch_size=len(document_ids),
+            with_count=False,
+        )
+        self._client._check_page_limit(response, len(document_ids))
+        return response
+
+    @staticmethod
+    def _resolve(
+        futures: dict[str, list[asyncio.Future[dict[str, Any] | None]]], task: asyncio.Task[DocumentsResponse]
+    ) -> None:
+        """Fan out documents of the chunk or its error to the awaiting callers."""
+        error = None if task.cancelled() else task.exception()
+        documents = {} if task.cancelled() or error else {d.get("documentId"): d for d in task.result().data}
+        for document_id, document_futures in futures.items():
+            for future in document_futures:
+                if future.done():
+                    continue
+                if task.cancelled():
+                    future.cancel()
+                elif error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(documents.get(document_id))
@@ -0,0 +1,46 @@
+import abc
+import json
+from typing import Any
+
+
+class JsonCodec(abc.ABC):
+    """Encoder and decoder of JSON request bodies and responses."""
+
+    @abc.abstractmethod
+    def dumps(self, data: Any) -> bytes:
+        """Encode data to JSON bytes."""
+
+    @abc.abstractmethod
+    def loads(self, content: bytes | str) -> Any:
+        """Decode JSON bytes to data."""
+
+
+class StdlibJsonCodec(JsonCodec):
+    """JSON codec based on standard library, compatible with default encoding of httpx2."""
+
+    def dumps(self, data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    def loads(self, content: bytes | str) -> Any:
+        return json.loads(content)
+
+
+class OrjsonCodec(JsonCodec):
+    """Fast JSON codec based on orjson, requires `strapi-client[orjson]` to be installed.
+
+    Unlike `StdlibJsonCodec`, it encodes NaN and infinity as null instead of raising an error,
+    and it accepts datetimes, UUIDs and non-string keys, so it is used only when passed explicitly.
+    """
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as e:
+            raise ImportError("orjson is required for OrjsonCodec, install it with `strapi-client[orjson]`") from e
+        self._orjson = orjson
+
+    def dumps(self, data: Any) -> bytes:
+        return self._orjson.dumps(data, option=self._orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, content: bytes | str) -> Any:
+        return self._orjson.loads(content)
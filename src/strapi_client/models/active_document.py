@@ -2,9 +2,12 @@ import datetime
 import hashlib
 import json
 import warnings
+from collections.abc import Set as AbstractSet
+from types import MappingProxyType
 from typing import Any, ClassVar, Self
 
 from pydantic import BaseModel, Field, PrivateAttr
+from pydantic.fields import FieldInfo
 
 from strapi_client.strapi_client_async import StrapiClientAsync
 
@@ -15,6 +18,26 @@ def DocumentField(*args, unique: bool = False, relation: bool = False, **kwargs)
     return field_info
 
 
+def _has_field_flag(field_info: FieldInfo, flag: str) -> bool:
+    """Check if the field is declared with the DocumentField flag, e.g. unique or relation."""
+    return any(isinstance(m, dict) and m.get(flag, False) for m in field_info.metadata)
+
+
+def _set_field_metadata(cls: type["ActiveDocument"]) -> None:
+    """Compute field metadata of the class once, field names map to aliases used by Strapi.
+
+    Fields are kept in declaration order, so query strings and cache keys built from them are the same
+    in all processes regardless of hash seed.
+    """
+    fields = cls.__pydantic_fields__
+    aliases = {f: info.alias or f for f, info in fields.items()}
+    cls.__field_aliases__ = MappingProxyType(aliases)
+    cls.__unique_fields__ = tuple(f for f, info in fields.items() if _has_field_flag(info, "unique"))
+    cls.__document_fields__ = tuple(aliases.values())
+    cls.__scalar_fields__ = tuple(aliases[f] for f, info in fields.items() if not _has_field_flag(info, "relation"))
+    cls.__relation_fields__ = tuple(aliases[f] for f, info in fields.items() if _has_field_flag(info, "relation"))
+
+
 class ActiveDocument(BaseModel):
     """Experimental ORM class for Strapi document."""
 
@@ -27,7 +50,18 @@ class ActiveDocument(BaseModel):
         "published_at",
         "__plural_api_id__",
         "__managed_fields__",
+        "__field_aliases__",
+        "__unique_fields__",
+        "__document_fields__",
+        "__scalar_fields__",
+        "__relation_fields__",
     }
+    # Field metadata computed once per class, field names map to aliases used by Strapi
+    __field_aliases__: ClassVar[MappingProxyType[str, str]]
+    __unique_fields__: ClassVar[tuple[str, ...]]
+    __document_fields__: ClassVar[tuple[str, ...]]
+    __scalar_fields__: ClassVar[tuple[str, ...]]
+    __relation_fields__: ClassVar[tuple[str, ...]]
     _relations_populated: bool = PrivateAttr(default=False)
     id: int | None = DocumentField(default=None, unique=True)
     document_id: str | None = DocumentField(default=None, alias="documentId", unique=True)
@@ -40,6 +74,7 @@ class ActiveDocument(BaseModel):
         super().__pydantic_init_subclass__(**kwargs)
         if "__plural_api_id__" not in cls.__dict__:
             cls.__plural_api_id__ = cls.__name__.lower() + "s"
+        _set_field_metadata(cls)
 
     @classmethod
     async def get_document(
@@ -104,7 +139,7 @@ class ActiveDocument(BaseModel):
                 "Some relations are not populated, so all relations will not be updated. Use refresh() method to populate relations."
             )
             # TODO: relations: set, connect, disconnect. Preserve hashing. Check warning
-            data = self.model_dump_variable(exclude=self._get_relation_fields())
+            data = self.model_dump_variable(exclude=set(self._get_relation_fields()))
         else:
             data = self.model_dump_variable()
         response = await client.update_document(
@@ -138,11 +173,12 @@ class ActiveDocument(BaseModel):
 
     async def upsert_document(self, client: StrapiClientAsync) -> Self:
         """Create document or update fields."""
-        keys: set[str] = self._unique_fields - self.__managed_fields__
+        keys = [key for key in self._unique_fields if key not in self.__managed_fields__]
         if not keys:
             raise RuntimeError("For upsert at least one model field should be declared as unique")
         model_dict = self.model_dump_variable()
-        filters = {key: {"$eq": model_dict[key]} for key in keys}
+        aliases = [self.__field_aliases__[key] for key in keys]
+        filters = {alias: {"$eq": model_dict[alias]} for alias in aliases}
         cur_response = await client.get_documents(
             plural_api_id=self.__plural_api_id__,
             filters=filters,
@@ -165,7 +201,7 @@ class ActiveDocument(BaseModel):
                 self.document_id = cur_document.document_id
                 return await self.update_document(client)
 
-    def model_dump_variable(self, exclude: set[str] | None = None) -> dict[str, Any]:
+    def model_dump_variable(self, exclude: AbstractSet[str] | None = None) -> dict[str, Any]:
         exclude = exclude or set()
         model_dict = self.model_dump(by_alias=True, exclude=self.__managed_fields__ | exclude)
         for rel in self._get_relation_fields():
@@ -178,21 +214,16 @@ class ActiveDocument(BaseModel):
         return hashlib.sha256(dumped_str.encode("utf-8")).hexdigest()
 
     @property
-    def _unique_fields(self) -> set[str]:
-        return {f for f, info in self.model_fields.items() if any(m.get("unique", False) for m in info.metadata)}
+    def _unique_fields(self) -> tuple[str, ...]:
+        return self.__unique_fields__
 
     @classmethod
-    def _get_document_fields(cls, with_relations: bool = True) -> set[str]:
-        return {
-            info.alias or f
-            for f, info in cls.__pydantic_fields__.items()
-            if with_relations or not any(m.get("relation", False) for m in info.metadata)
-        }
+    def _get_document_fields(cls, with_relations: bool = True) -> tuple[str, ...]:
+        return cls.__document_fields__ if with_relations else cls.__scalar_fields__
 
     @classmethod
-    def _get_relation_fields(cls) -> set[str]:
-        return {
-            info.alias or f
-            for f, info in cls.__pydantic_fields__.items()
-            if any(m.get("relation", False) for m in info.metadata)
-        }
+    def _get_relation_fields(cls) -> tuple[str, ...]:
+        return cls.__relation_fields__
+
+
+_set_field_metadata(ActiveDocument)  # Subclasses compute their metadata in __pydantic_init_subclass__
@@ -0,0 +1,25 @@
+from typing import Self
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class AdaptiveConcurrency(BaseModel):
+    """Configuration of adaptive limit of concurrent requests.
+
+    The limit grows additively while p95 latency stays under `target_latency`
+    and is cut multiplicatively on throttling, server errors or latency spikes.
+    """
+
+    initial_limit: int = Field(default=4, ge=1)
+    min_limit: int = Field(default=1, ge=1)
+    max_limit: int = Field(default=64, ge=1)
+    target_latency: float = Field(default=1.0, gt=0, description="Target p95 latency in seconds")
+    increase_step: float = Field(default=1.0, gt=0)
+    decrease_factor: float = Field(default=0.5, gt=0, lt=1)
+    window_size: int = Field(default=20, ge=1, description="Number of requests to calculate p95 latency")
+
+    @model_validator(mode="after")
+    def check_limits(self) -> Self:
+        if not self.min_limit <= self.initial_limit <= self.max_limit:
+            raise ValueError("Limits must satisfy min_limit <= initial_limit <= max_limit")
+        return self
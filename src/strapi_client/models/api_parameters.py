@@ -1,8 +1,23 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any, Self
 
 import qs_codec
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    from strapi_client.models.query_plan import QueryPlan
+
+
+def encode_selection(
+    populate: list[str] | dict[str, Any] | str | None = None, fields: list[str] | str | None = None
+) -> str:
+    """Encode populate and fields parameters to a URL-encoded query string fragment."""
+    params: dict[str, Any] = {}
+    if populate:
+        params["populate"] = populate
+    if fields:
+        params["fields"] = fields
+    return qs_codec.encode(params)
+
 
 class ApiParameters(BaseModel):
     """Parameters for Strapi API requests.
@@ -23,6 +38,19 @@ class ApiParameters(BaseModel):
     limit: int | None = None
     publication_state: str | None = None
     locale: str | None = None
+    encoded_selection: str | None = None  # Pre-encoded populate and fields, used instead of them when set
+
+    def with_query_plan(self, query_plan: "QueryPlan | None") -> Self:
+        """Get copy of parameters with fields and populate taken from the query plan, if any."""
+        if query_plan is None:
+            return self
+        return self.model_copy(
+            update={
+                "populate": query_plan.populate,
+                "fields": query_plan.fields,
+                "encoded_selection": query_plan.encoded_query,
+            }
+        )
 
     def stringify(self) -> str:
         """Convert API parameters to a URL-encoded query string.
@@ -51,14 +79,48 @@ class ApiParameters(BaseModel):
             params["sort"] = self.sort
         if self.filters:
             params["filters"] = self.filters
-        if self.populate:
-            params["populate"] = self.populate
-        if self.fields:
-            params["fields"] = self.fields
+        selection = self.encoded_selection
+        if selection is None:
+            selection = encode_selection(self.populate, self.fields)
+        tail_params: dict[str, Any] = {}
         if pagination:
-            params["pagination"] = pagination
+            tail_params["pagination"] = pagination
         if self.publication_state:
-            params["publicationState"] = self.publication_state
+            tail_params["publicationState"] = self.publication_state
         if self.locale:
-            params["locale"] = self.locale
-        return qs_codec.encode(params)
+            tail_params["locale"] = self.locale
+        # Parts are encoded separately to reuse the selection, joined in the same order as a single dict
+        return "&".join(part for part in (qs_codec.encode(params), selection, qs_codec.encode(tail_params)) if part)
+
+    def keyset_page(self, keyset_field: str, last_value: Any | None = None) -> Self:
+        """Get parameters for the next page of keyset pagination.
+
+        The page is sorted by `keyset_field` and starts after `last_value`, so that deep offsets are never used.
+
+        Args:
+            keyset_field: Unique monotonic field to paginate by.
+            last_value: Value of `keyset_field` in the last document of the previous page.
+
+        Returns:
+            ApiParameters: Copy of parameters for the next page.
+        """
+        filters = self.filters
+        if last_value is not None:
+            keyset_filter = {keyset_field: {"$gt": last_value}}
+            filters = {"$and": [filters, keyset_filter]} if filters else keyset_filter
+        fields = self.fields
+        if fields:
+            fields = [fields] if isinstance(fields, str) else fields
+            if keyset_field not in fields:
+                fields = [*fields, keyset_field]
+        return self.model_copy(
+            update={
+                "sort": [f"{keyset_field}:asc"],
+                "filters": filters,
+                "fields": fields,
+                "encoded_selection": self.encoded_selection if fields == self.fields else None,
+                "page": None,
+                "start": 0,
+                "with_count": False,
+            }
+        )
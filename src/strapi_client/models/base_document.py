@@ -1,9 +1,12 @@
 import datetime
-from typing import Self
+import functools
+from typing import Any, Self
 
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 
 from strapi_client.models.base_populatable import BasePopulatable
+from strapi_client.models.cooperative_validation import CooperativeValidation, run_in_time_slices
+from strapi_client.models.lazy_document_list import LazyDocumentList
 from strapi_client.models.response import DocumentResponse, DocumentsResponse
 
 
@@ -22,11 +25,39 @@ class BaseDocument(BasePopulatable):
 
     @classmethod
     def from_list_response(cls, response: DocumentsResponse) -> list[Self]:
-        return [cls.model_validate(d) for d in response.data]
+        return cls._validate_rows(response.data)
+
+    @classmethod
+    async def afrom_list_response(
+        cls, response: DocumentsResponse, config: CooperativeValidation | None = None
+    ) -> list[Self]:
+        """Build documents from response in chunks, yielding to the event loop between chunks."""
+        return await run_in_time_slices(response.data, cls._validate_rows, config or CooperativeValidation())
+
+    @classmethod
+    def lazy_from_list_response(cls, response: DocumentsResponse) -> LazyDocumentList[Self]:
+        """Build sequence of documents validated one by one on first access."""
+        return LazyDocumentList(cls, response.data)
+
+    @classmethod
+    def from_list_json(cls, content: bytes | str) -> list[Self]:
+        """Validate JSON array of documents directly from response content without intermediate dicts."""
+        return _get_list_adapter(cls).validate_json(content)
 
     @classmethod
     def first_from_list_response(cls, response: DocumentsResponse) -> Self | None:
-        return cls.model_validate(response.data[0]) if len(response.data) > 0 else None
+        if len(response.data) == 0:
+            return None
+        return cls.model_validate(response.data[0])
+
+    @classmethod
+    def _validate_rows(cls, rows: list[dict[str, Any]]) -> list[Self]:
+        return _get_list_adapter(cls).validate_python(rows)
+
+
+@functools.cache
+def _get_list_adapter(model: type[BaseDocument]) -> TypeAdapter[list[Any]]:
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
 
 
 class BaseDocumentWithLocale(BaseDocument):
@@ -0,0 +1,34 @@
+from pydantic import BaseModel
+
+from strapi_client.models.response import DocumentResponse
+
+
+class BulkItemResult(BaseModel):
+    """Result of a single operation of a bulk request."""
+
+    index: int
+    document_id: str | None = None
+    response: DocumentResponse | None = None
+    error: str | None = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+class BulkResult(BaseModel):
+    """Report of a bulk request with results of operations in input order."""
+
+    items: list[BulkItemResult]
+
+    @property
+    def succeeded(self) -> list[BulkItemResult]:
+        return [item for item in self.items if item.success]
+
+    @property
+    def failed(self) -> list[BulkItemResult]:
+        return [item for item in self.items if not item.success]
+
+    @property
+    def success(self) -> bool:
+        return all(item.success for item in self.items)
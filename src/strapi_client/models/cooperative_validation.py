@@ -0,0 +1,58 @@
+import asyncio
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class CooperativeValidation(BaseModel):
+    """Settings of validating large responses without blocking the event loop.
+
+    Rows are validated in chunks sized to take up to `max_time_slice` seconds, and control is returned
+    to the event loop between chunks. With `offload_to_thread`, chunks and parsing of responses larger than
+    `min_offload_bytes` run in a worker thread.
+    """
+
+    max_time_slice: float = Field(default=0.01, gt=0)
+    offload_to_thread: bool = False
+    min_offload_bytes: int = Field(default=256 * 1024, ge=0)
+
+
+async def run_in_time_slices(
+    items: list[T], process: Callable[[list[T]], list[R]], config: CooperativeValidation
+) -> list[R]:
+    """Process items in chunks fitting into the time slice and yield to the event loop between chunks.
+
+    Chunk size starts small and is adjusted after every chunk according to the measured time per item.
+
+    Args:
+        items: Items to process, e.g. rows of response.
+        process: Function processing a chunk of items.
+        config: Time slice and thread offloading settings.
+
+    Returns:
+        list: Processed items in input order.
+    """
+    results: list[R] = []
+    chunk_size = 16
+    start = 0
+    while start < len(items):
+        chunk = items[start : start + chunk_size]
+        started_at = time.perf_counter()
+        if config.offload_to_thread:
+            results += await asyncio.to_thread(process, chunk)
+        else:
+            results += process(chunk)
+        elapsed = time.perf_counter() - started_at
+        start += len(chunk)
+        if elapsed > 0:
+            chunk_size = max(1, int(config.max_time_slice * len(chunk) / elapsed))
+        else:
+            chunk_size *= 2
+        if not config.offload_to_thread and start < len(items):
+            await asyncio.sleep(0)  # Let other tasks run between chunks
+    return results
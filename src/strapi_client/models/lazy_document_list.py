@@ -0,0 +1,67 @@
+from collections.abc import Iterator, Sequence
+from typing import Any, Generic, TypeVar, overload
+
+from pydantic import BaseModel
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+_NOT_VALIDATED: Any = object()
+
+
+class LazyDocumentList(Sequence[ModelType], Generic[ModelType]):
+    """Read-only sequence of documents validated from response rows on first access.
+
+    Validated documents are cached, so each row is validated at most once. Slices are views
+    sharing the cache with the original sequence.
+    """
+
+    def __init__(
+        self,
+        model_class: type[ModelType],
+        rows: list[dict[str, Any]],
+        _cache: list[Any] | None = None,
+        _indices: range | None = None,
+    ) -> None:
+        self._model_class = model_class
+        self._rows = rows
+        self._cache = _cache if _cache is not None else [_NOT_VALIDATED] * len(rows)
+        self._indices = _indices if _indices is not None else range(len(rows))
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, index: int) -> ModelType: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "LazyDocumentList[ModelType]": ...
+
+    def __getitem__(self, index: int | slice) -> "ModelType | LazyDocumentList[ModelType]":
+        if isinstance(index, slice):
+            return LazyDocumentList(self._model_class, self._rows, self._cache, self._indices[index])
+        return self._get(self._indices[index])
+
+    def __iter__(self) -> Iterator[ModelType]:
+        for i in self._indices:
+            yield self._get(i)
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyDocumentList({self._model_class.__name__}, {len(self)} documents, {self.validated_count} validated)"
+        )
+
+    @property
+    def validated_count(self) -> int:
+        """Number of documents validated so far."""
+        return sum(1 for i in self._indices if self._cache[i] is not _NOT_VALIDATED)
+
+    def to_list(self) -> list[ModelType]:
+        """Validate all remaining documents and return them as a list."""
+        return list(self)
+
+    def _get(self, row_index: int) -> ModelType:
+        document = self._cache[row_index]
+        if document is _NOT_VALIDATED:
+            document = self._model_class.model_validate(self._rows[row_index])
+            self._cache[row_index] = document
+        return document
@@ -0,0 +1,53 @@
+import functools
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel
+
+from strapi_client.models.response import TypedDocumentResponse, TypedDocumentsResponse
+from strapi_client.types import ExportFormat
+
+DocumentType = TypeVar("DocumentType", bound=BaseModel)
+
+
+class DocumentsPage(BaseModel, Generic[DocumentType]):
+    """Page of documents validated directly into the document model."""
+
+    data: list[DocumentType]
+
+
+@functools.cache
+def get_documents_page_type(model_class: type[DocumentType]) -> type[DocumentsPage[DocumentType]]:
+    """Get page model of the document class, parametrized once per class."""
+    return DocumentsPage[model_class]  # type: ignore[valid-type]
+
+
+@functools.cache
+def get_documents_response_type(model_class: type[DocumentType]) -> type[TypedDocumentsResponse[DocumentType]]:
+    """Get documents response model of the document class, parametrized once per class."""
+    return TypedDocumentsResponse[model_class]  # type: ignore[valid-type]
+
+
+@functools.cache
+def get_document_response_type(model_class: type[DocumentType]) -> type[TypedDocumentResponse[DocumentType]]:
+    """Get single document response model of the document class, parametrized once per class."""
+    return TypedDocumentResponse[model_class]  # type: ignore[valid-type]
+
+
+def validate_page(model_class: type[DocumentType], content: bytes, output: ExportFormat) -> list[Any] | bytes:
+    """
+    Validate raw content of a page of documents.
+
+    Designed to run in worker processes, so it accepts and returns only picklable values.
+
+    Args:
+        model_class: The document model class, importable by worker processes
+        content: Raw content of the page response
+        output: "models" to return list of documents, "ndjson" to return documents serialized to NDJSON lines
+
+    Returns:
+        list[Any] | bytes: Validated documents or NDJSON lines
+    """
+    documents: list[BaseModel] = get_documents_page_type(model_class).model_validate_json(content).data
+    if output == "ndjson":
+        return b"".join(document.model_dump_json(by_alias=True).encode() + b"\n" for document in documents)
+    return documents
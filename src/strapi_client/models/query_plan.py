@@ -0,0 +1,23 @@
+from typing import Any, Self
+
+from pydantic import BaseModel, ConfigDict
+
+from strapi_client.models.api_parameters import encode_selection
+
+
+class QueryPlan(BaseModel):
+    """Fields and populate structure of a model with their pre-encoded query string fragment.
+
+    Plans are shared between requests, so their fields and populate structure must not be mutated.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    fields: list[str]
+    populate: dict[str, Any]
+    encoded_query: str
+
+    @classmethod
+    def build(cls, fields: list[str], populate: dict[str, Any]) -> Self:
+        """Build plan encoding its query string fragment once."""
+        return cls(fields=fields, populate=populate, encoded_query=encode_selection(populate, fields))
@@ -0,0 +1,9 @@
+from pydantic import BaseModel, Field
+
+
+class RateLimit(BaseModel):
+    """Client-side limit of request rate and number of requests in flight."""
+
+    requests_per_second: float | None = Field(default=None, gt=0)
+    burst: int = Field(default=1, ge=1)
+    max_in_flight: int | None = Field(default=None, ge=1)
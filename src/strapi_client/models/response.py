@@ -1,7 +1,9 @@
-from typing import Any
+from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel, Field
 
+DocumentType = TypeVar("DocumentType", bound=BaseModel)
+
 
 class ResponsePagination(BaseModel):
     page: int | None = None
@@ -26,5 +28,24 @@ class DocumentsResponse(BaseModel):
     meta: ResponseMeta
 
 
+class TypedDocumentsResponse(BaseModel, Generic[DocumentType]):
+    """Page of documents validated directly into the document model, with pagination metadata."""
+
+    data: list[DocumentType]
+    meta: ResponseMeta
+
+
+class DocumentsPageMeta(BaseModel):
+    """Page of documents with only pagination metadata parsed."""
+
+    meta: ResponseMeta
+
+
 class DocumentResponse(BaseModel):
     data: dict[str, Any]
+
+
+class TypedDocumentResponse(BaseModel, Generic[DocumentType]):
+    """Document validated directly into the document model."""
+
+    data: DocumentType
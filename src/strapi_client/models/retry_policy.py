@@ -0,0 +1,66 @@
+import datetime
+import email.utils
+import random
+
+import httpx2
+from pydantic import BaseModel, Field
+
+
+class RetryPolicy(BaseModel):
+    """Policy of retrying failed requests with exponential backoff.
+
+    Only idempotent methods are retried by default. A delay before the next attempt grows exponentially
+    with optional full jitter, and `Retry-After` header of the response takes precedence when present.
+    Delays requested by `Retry-After` are capped by `max_retry_after`.
+    """
+
+    max_retries: int = Field(default=3, ge=0)
+    backoff_factor: float = Field(default=0.5, ge=0)
+    max_backoff: float = Field(default=30.0, ge=0)
+    jitter: bool = True
+    retry_statuses: set[int] = {429, 500, 502, 503, 504}
+    retry_methods: set[str] = {"GET", "PUT", "DELETE"}
+    retry_transport_errors: bool = True
+    respect_retry_after: bool = True
+    max_retry_after: float = Field(default=300.0, ge=0)
+
+    def get_delay(self, method: str, attempt: int, response: httpx2.Response | None = None) -> float | None:
+        """Get delay before the next attempt.
+
+        Args:
+            method: HTTP method of the request.
+            attempt: Number of the failed attempt starting from 0.
+            response: Response of the failed attempt or None if request failed with transport error.
+
+        Returns:
+            float | None: Delay in seconds or None if request should not be retried.
+        """
+        if attempt >= self.max_retries or method.upper() not in self.retry_methods:
+            return None
+        if response is None:
+            if not self.retry_transport_errors:
+                return None
+        elif response.status_code not in self.retry_statuses:
+            return None
+        if response is not None and self.respect_retry_after:
+            retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        backoff = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    @staticmethod
+    def _parse_retry_after(value: str | None) -> float | None:
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=datetime.UTC)
+        return max((retry_at - datetime.datetime.now(datetime.UTC)).total_seconds(), 0.0)
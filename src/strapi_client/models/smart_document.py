@@ -1,15 +1,21 @@
+import asyncio
 import re
 import warnings
+from collections import deque
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor
 from io import BytesIO
 from pathlib import Path
-from typing import Any, ClassVar, Self
+from typing import Any, ClassVar, Literal, Self
 
 from pydantic import BaseModel
 
 from strapi_client.models.base_document import BaseDocument
-from strapi_client.models.response import ResponseMeta
-from strapi_client.models.smart_document_utils import get_model_data, get_model_fields_and_population
+from strapi_client.models.page_validation import get_document_response_type, get_documents_response_type, validate_page
+from strapi_client.models.response import ResponseMeta, TypedDocumentsResponse
+from strapi_client.models.smart_document_utils import get_model_data, get_query_plan, invalidate_query_plans
 from strapi_client.strapi_client_async import StrapiClientAsync
+from strapi_client.types import ExportFormat, PaginationMode
 from strapi_client.utils import hash_model, serialize_document_data
 
 
@@ -40,6 +46,31 @@ class SmartDocument(BaseDocument):
             cls.__plural_api_id__ = f"{cls.__singular_api_id__}s"
         if not hasattr(cls, "__content_type_id__"):
             cls.__content_type_id__ = f"api::{cls.__singular_api_id__}.{cls.__singular_api_id__}"
+        invalidate_query_plans()  # New class may resolve forward references of already planned classes
+
+    @classmethod
+    def invalidate_query_plan(cls) -> None:
+        """Drop cached fields and populate structure of the class, e.g. after its fields are changed at runtime."""
+        invalidate_query_plans(cls)
+
+    @classmethod
+    async def _iter_typed_pages(
+        cls, client: StrapiClientAsync, **kwargs: Any
+    ) -> AsyncIterator[TypedDocumentsResponse[Self]]:
+        """Iterate over pages of documents validated directly from response content.
+
+        If cooperative validation is configured in the client, rows are parsed first and validated in time slices.
+        """
+        query_plan = get_query_plan(cls)
+        if client.cooperative_validation is None:
+            async for typed_response in client.iter_model_pages(
+                cls, cls.__plural_api_id__, query_plan=query_plan, **kwargs
+            ):
+                yield typed_response
+            return
+        async for response in client.iter_pages(cls.__plural_api_id__, query_plan=query_plan, **kwargs):
+            documents = await cls.afrom_list_response(response, client.cooperative_validation)
+            yield get_documents_response_type(cls).model_construct(data=documents, meta=response.meta)
 
     @classmethod
     async def get_document(
@@ -48,14 +79,29 @@ class SmartDocument(BaseDocument):
         document_id: str,
     ) -> Self:
         """Get document by document id."""
-        fields, populate = get_model_fields_and_population(cls)
-        response = await client.get_document(
+        query_plan = get_query_plan(cls)
+        content = await client.get_raw_document(
             plural_api_id=cls.__plural_api_id__,
             document_id=document_id,
-            fields=fields,
-            populate=populate,
+            query_plan=query_plan,
         )
-        return cls.from_scalar_response(response)
+        return get_document_response_type(cls).model_validate_json(content).data
+
+    @classmethod
+    async def load_document(
+        cls,
+        client: StrapiClientAsync,
+        document_id: str,
+    ) -> Self | None:
+        """Load document by document id in a batch with other documents loaded concurrently.
+
+        Returns None if document is not found.
+        """
+        query_plan = get_query_plan(cls)
+        data = await client.loader.load(cls.__plural_api_id__, document_id, query_plan=query_plan)
+        if data is None:
+            return None
+        return cls.model_validate(data)
 
     @classmethod
     async def get_documents(
@@ -67,25 +113,163 @@ class SmartDocument(BaseDocument):
         locale: str | None = None,
         start: int | None = None,
         page: int | None = None,
-        limit: int = 100,
+        limit: int | Literal["auto"] = 100,
         with_count: bool = True,
+        max_concurrency: int = 1,
+        pagination_mode: PaginationMode = "offset",
+        keyset_field: str = "id",
     ) -> list[Self]:
         """Get list of documents."""
-        fields, populate = get_model_fields_and_population(cls)
-        response = await client.get_documents(
-            plural_api_id=cls.__plural_api_id__,
+        documents: list[Self] = []
+        async for typed_response in cls._iter_typed_pages(
+            client,
             sort=sort or ["id"],
             filters=filters,
-            populate=populate,
-            fields=fields,
             publication_state=publication_state,
             locale=locale,
             page=page,
             start=start,
             batch_size=limit,
             with_count=with_count,
-        )
-        return cls.from_list_response(response)
+            max_concurrency=max_concurrency,
+            pagination_mode=pagination_mode,
+            keyset_field=keyset_field,
+        ):
+            documents += typed_response.data
+        return documents
+
+    @classmethod
+    async def iter_documents(
+        cls,
+        client: StrapiClientAsync,
+        sort: list[str] | None = None,
+        filters: dict[str, Any] | None = None,
+        publication_state: str | None = None,
+        locale: str | None = None,
+        limit: int | Literal["auto"] = 100,
+        with_count: bool = True,
+        max_concurrency: int = 1,
+        pagination_mode: PaginationMode = "offset",
+        keyset_field: str = "id",
+    ) -> AsyncIterator[Self]:
+        """Iterate over all documents page by page."""
+        async for typed_response in cls._iter_typed_pages(
+            client,
+            sort=sort or ["id"],
+            filters=filters,
+            publication_state=publication_state,
+            locale=locale,
+            batch_size=limit,
+            with_count=with_count,
+            max_concurrency=max_concurrency,
+            pagination_mode=pagination_mode,
+            keyset_field=keyset_field,
+        ):
+            for document in typed_response.data:
+                yield document
+
+    @classmethod
+    async def export_documents(
+        cls,
+        client: StrapiClientAsync,
+        executor: Executor,
+        sort: list[str] | None = None,
+        filters: dict[str, Any] | None = None,
+        publication_state: str | None = None,
+        locale: str | None = None,
+        limit: int = 100,
+        max_concurrency: int = 4,
+        max_pending_pages: int = 8,
+    ) -> AsyncIterator[list[Self]]:
+        """Export all documents page by page, validating raw pages in executor.
+
+        With `ProcessPoolExecutor`, pages are validated on all CPU cores while next pages are downloaded.
+        The class must be importable by worker processes, i.e. defined at module level.
+        """
+        async for page in cls._export_pages(
+            client,
+            executor,
+            "models",
+            sort,
+            filters,
+            publication_state,
+            locale,
+            limit,
+            max_concurrency,
+            max_pending_pages,
+        ):
+            yield page
+
+    @classmethod
+    async def export_ndjson(
+        cls,
+        client: StrapiClientAsync,
+        executor: Executor,
+        sort: list[str] | None = None,
+        filters: dict[str, Any] | None = None,
+        publication_state: str | None = None,
+        locale: str | None = None,
+        limit: int = 100,
+        max_concurrency: int = 4,
+        max_pending_pages: int = 8,
+    ) -> AsyncIterator[bytes]:
+        """Export all documents as NDJSON lines page by page, validating and serializing raw pages in executor.
+
+        With `ProcessPoolExecutor`, pages are processed on all CPU cores while next pages are downloaded.
+        The class must be importable by worker processes, i.e. defined at module level.
+        """
+        async for page in cls._export_pages(
+            client,
+            executor,
+            "ndjson",
+            sort,
+            filters,
+            publication_state,
+            locale,
+            limit,
+            max_concurrency,
+            max_pending_pages,
+        ):
+            yield page
+
+    @classmethod
+    async def _export_pages(
+        cls,
+        client: StrapiClientAsync,
+        executor: Executor,
+        output: ExportFormat,
+        sort: list[str] | None,
+        filters: dict[str, Any] | None,
+        publication_state: str | None,
+        locale: str | None,
+        limit: int,
+        max_concurrency: int,
+        max_pending_pages: int,
+    ) -> AsyncIterator[Any]:
+        if max_pending_pages < 1:
+            raise ValueError("max_pending_pages must be greater than or equal to 1")
+        query_plan = get_query_plan(cls)
+        loop = asyncio.get_running_loop()
+        pending: deque[asyncio.Future[Any]] = deque()
+        try:
+            async for content in client.iter_raw_pages(
+                plural_api_id=cls.__plural_api_id__,
+                sort=sort or ["id"],
+                filters=filters,
+                query_plan=query_plan,
+                publication_state=publication_state,
+                locale=locale,
+                batch_size=limit,
+                max_concurrency=max_concurrency,
+            ):
+                pending.append(loop.run_in_executor(executor, validate_page, cls, content, output))
+                if len(pending) >= max_pending_pages:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for future in pending:
+                future.cancel()
 
     @classmethod
     async def get_documents_with_meta(
@@ -101,21 +285,20 @@ class SmartDocument(BaseDocument):
         with_count: bool = True,
     ) -> tuple[list[Self], ResponseMeta]:
         """Get list of documents."""
-        fields, populate = get_model_fields_and_population(cls)
-        response = await client.get_documents(
-            plural_api_id=cls.__plural_api_id__,
+        documents: list[Self] = []
+        async for typed_response in cls._iter_typed_pages(
+            client,
             sort=sort,
             filters=filters,
-            populate=populate,
-            fields=fields,
             publication_state=publication_state,
             locale=locale,
             page=page,
             start=start,
             batch_size=limit,
             with_count=with_count,
-        )
-        return cls.from_list_response(response), response.meta
+        ):
+            documents += typed_response.data
+        return documents, typed_response.meta
 
     @classmethod
     async def get_first_document(
@@ -127,20 +310,19 @@ class SmartDocument(BaseDocument):
         locale: str | None = None,
     ) -> Self | None:
         """First documents if available."""
-        fields, populate = get_model_fields_and_population(cls)
-        response = await client.get_documents(
-            plural_api_id=cls.__plural_api_id__,
-            sort=sort,
-            filters=filters,
-            populate=populate,
-            fields=fields,
-            publication_state=publication_state,
-            locale=locale,
-            start=0,
-            batch_size=1,
-            with_count=False,
+        typed_response = await anext(
+            cls._iter_typed_pages(
+                client,
+                sort=sort,
+                filters=filters,
+                publication_state=publication_state,
+                locale=locale,
+                start=0,
+                batch_size=1,
+                with_count=False,
+            )
         )
-        return cls.first_from_list_response(response)
+        return typed_response.data[0] if typed_response.data else None
 
     @classmethod
     async def create_document(
@@ -153,8 +335,7 @@ class SmartDocument(BaseDocument):
             plural_api_id=cls.__plural_api_id__,
             data=serialize_document_data(data),
         )
-        _, populate = get_model_fields_and_population(cls)
-        if not populate:
+        if not get_query_plan(cls).populate:
             return cls.from_scalar_response(response)
         else:
             result_document = BaseDocument.from_scalar_response(response)
@@ -189,7 +370,6 @@ class SmartDocument(BaseDocument):
         do_not_compare_fields: list[str] | None = None,
     ) -> Self:
         """Update existing document."""
-        _, populate = get_model_fields_and_population(self.__class__)
         if not lazy_mode and do_not_compare_fields:
             warnings.warn("do_not_compare_fields argument works only in lazy mode")
         elif lazy_mode and self.model_identical(data=data, exclude_fields=do_not_compare_fields):
@@ -199,7 +379,7 @@ class SmartDocument(BaseDocument):
             document_id=self.document_id,
             data=serialize_document_data(data),
         )
-        if not populate:
+        if not get_query_plan(self.__class__).populate:
             result_document = self.__class__.from_scalar_response(response)
             self.__dict__.update(result_document.__dict__)
             return self
@@ -254,12 +434,11 @@ class SmartDocument(BaseDocument):
 
     async def refresh_document(self, client: StrapiClientAsync) -> Self:
         """Refresh the document with the latest data from Strapi."""
-        fields, populate = get_model_fields_and_population(self.__class__)
+        query_plan = get_query_plan(self.__class__)
         response = await client.get_document(
             plural_api_id=self.__plural_api_id__,
             document_id=self.document_id,
-            fields=fields,
-            populate=populate,
+            query_plan=query_plan,
         )
         document = self.from_scalar_response(response)
         self.__dict__.update(document.__dict__)
@@ -8,8 +8,10 @@ This module provides functions for:
 4. Processing model data for API requests
 """
 
+import functools
+from collections.abc import Callable
 from types import UnionType
-from typing import Any, TypeVar, Union, cast, get_args, get_origin
+from typing import Annotated, Any, Literal, TypeVar, Union, cast, get_args, get_origin
 
 from pydantic import BaseModel
 
@@ -17,6 +19,7 @@ from strapi_client.models.base_component import BaseComponent
 from strapi_client.models.base_document import BaseDocument
 from strapi_client.models.base_populatable import BasePopulatable
 from strapi_client.models.media_image_document import MediaImageDocument
+from strapi_client.models.query_plan import QueryPlan
 
 # Type variables for better type hints
 T = TypeVar("T")
@@ -193,52 +196,93 @@ def get_model_data(
         Dictionary representation of the document with nested BaseDocument instances
         replaced with their IDs
     """
-    # Get the model data as a dictionary with aliases
-    data = document.model_dump(by_alias=True, mode="json" if json_mode else "python")
+    return _get_model_data_serializer(type(document))(document, exclude_managed_fields, json_mode)
 
-    # Get managed fields if provided or available on the document
-    if exclude_managed_fields and hasattr(document, "__managed_fields__"):
-        fields_to_exclude: set[str] = cast(set[str], document.__managed_fields__)
-    else:
-        fields_to_exclude = set()
-
-    # Get model fields information for finding original field names
-    model_fields = get_model_fields(type(document))
-
-    # Process the data to replace nested BaseDocument instances with their IDs
-    result: dict[str, Any] = {}
-    for key, value in data.items():
-        # Find the original field name and info
-        original_field_name = None
-        for orig_name, info in model_fields.items():
-            if get_field_name(orig_name, info) == key:
-                original_field_name = orig_name
-                break
-
-        # Skip managed fields if exclude_managed_fields is True
-        if exclude_managed_fields and original_field_name and original_field_name in fields_to_exclude:
-            continue
-
-        # Get the actual field value from the original document
-        if original_field_name and hasattr(document, original_field_name):
-            original_value = getattr(document, original_field_name)
-        else:
-            # Fallback to serialized value if we can't find the original field
-            original_value = value
-
-        # Replace nested BaseDocument instances with their IDs based on actual value type
-        if isinstance(original_value, BaseDocument):
-            result[key] = original_value.id
-        elif isinstance(original_value, list) and original_value:
-            if all(isinstance(item, BaseDocument) for item in original_value):
-                result[key] = [item.id for item in original_value]
-            else:
-                result[key] = value
-        else:
-            # Scalar field or other type - use serialized value
-            result[key] = value
 
-    return result
+ModelDataSerializer = Callable[[BaseModel, bool, bool], dict[str, Any]]
+
+
+@functools.cache
+def _get_model_data_serializer(model_class: type[BaseModel]) -> ModelDataSerializer:
+    """
+    Build serializer of the model class with field names of output keys and relation slots resolved once.
+
+    Args:
+        model_class: The Pydantic model class
+
+    Returns:
+        ModelDataSerializer: Function of document, exclude_managed_fields and json_mode flags
+    """
+    model_fields = get_model_fields(model_class)
+
+    # Output keys are aliases, the first field with matching alias or name is the original field
+    field_names: dict[str, str] = {}
+    for field_name, field_info in model_fields.items():
+        field_names.setdefault(get_field_name(field_name, field_info), field_name)
+
+    # Only fields which annotations allow BaseDocument values need to be checked for nested documents
+    relation_slots = {
+        key: field_name
+        for key, field_name in field_names.items()
+        if may_hold_document(model_fields[field_name].annotation)
+    }
+
+    managed_fields: set[str] = cast(set[str], getattr(model_class, "__managed_fields__", set()))
+    managed_keys = {key for key, field_name in field_names.items() if field_name in managed_fields}
+    # Managed fields dumped under their own key are not serialized at all
+    dump_exclude = {
+        field_name
+        for key, field_name in field_names.items()
+        if key in managed_keys and (model_fields[field_name].serialization_alias or key) == key
+    }
+
+    def serialize(document: BaseModel, exclude_managed_fields: bool, json_mode: bool) -> dict[str, Any]:
+        exclude = exclude_managed_fields and bool(managed_keys)
+        data = document.model_dump(
+            by_alias=True, mode="json" if json_mode else "python", exclude=dump_exclude if exclude else None
+        )
+        if exclude:
+            data = {key: value for key, value in data.items() if key not in managed_keys}
+        for key, field_name in relation_slots.items():
+            if key not in data:
+                continue
+            value = getattr(document, field_name, None)
+            if isinstance(value, BaseDocument):
+                data[key] = value.id
+            elif isinstance(value, list) and value and all(isinstance(item, BaseDocument) for item in value):
+                data[key] = [item.id for item in value]
+        return data
+
+    return serialize
+
+
+def may_hold_document(annotation: Any) -> bool:
+    """
+    Check if field with the annotation may hold BaseDocument instance or list of them.
+
+    Unknown annotations, e.g. Any or forward references, are considered to hold documents.
+
+    Args:
+        annotation: The field annotation to check
+
+    Returns:
+        bool: False if field values are never documents
+    """
+    if annotation is Any or annotation is object:
+        return True
+    if annotation is type(None):
+        return False
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return False
+    if origin is Annotated:
+        return may_hold_document(get_args(annotation)[0])
+    if origin is not None or isinstance(annotation, UnionType):
+        return any(may_hold_document(arg) for arg in get_args(annotation))
+    if isinstance(annotation, type):
+        # Models may be subclassed by documents, untyped containers may contain them
+        return issubclass(annotation, BaseModel | list | tuple | set | dict)
+    return True
 
 
 class PopulateStructureBuilder:
@@ -383,3 +427,36 @@ def get_model_fields_and_population(model_class: type[BaseModel]) -> tuple[list[
     """
     builder = PopulateStructureBuilder()
     return builder.get_model_fields_and_population(model_class)
+
+
+_query_plans: dict[type[BaseModel], QueryPlan] = {}
+
+
+def get_query_plan(model_class: type[BaseModel]) -> QueryPlan:
+    """
+    Get fields, populate structure and encoded query of the model, computed once per class.
+
+    Args:
+        model_class: The Pydantic model class
+
+    Returns:
+        QueryPlan: Cached query plan of the model
+    """
+    query_plan = _query_plans.get(model_class)
+    if query_plan is None:
+        query_plan = QueryPlan.build(*get_model_fields_and_population(model_class))
+        _query_plans[model_class] = query_plan
+    return query_plan
+
+
+def invalidate_query_plans(model_class: type[BaseModel] | None = None) -> None:
+    """
+    Drop cached query plans, e.g. after models are rebuilt.
+
+    Args:
+        model_class: The model class to drop plan of, all plans are dropped if not provided
+    """
+    if model_class is None:
+        _query_plans.clear()
+    else:
+        _query_plans.pop(model_class, None)
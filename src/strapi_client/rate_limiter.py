@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
+
+from strapi_client.models.rate_limit import RateLimit
+
+
+class TokenBucket:
+    """Thread-safe token bucket that reserves tokens in order of requests."""
+
+    rate: float
+    burst: int
+    _tokens: float
+    _updated_at: float
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve a token and return delay in seconds before it becomes available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class RateLimiter:
+    """Rate limiter and concurrency governor for client requests.
+
+    The client-wide limit applies to every request, and the limit of the longest matching route prefix
+    applies additionally to requests of that route.
+    """
+
+    rate_limit: RateLimit | None
+    route_rate_limits: dict[str, RateLimit]
+
+    def __init__(self, rate_limit: RateLimit | None = None, route_rate_limits: dict[str, RateLimit] | None = None):
+        self.rate_limit = rate_limit
+        self.route_rate_limits = {prefix.strip("/"): limit for prefix, limit in (route_rate_limits or {}).items()}
+        self._buckets: dict[str | None, TokenBucket] = {}
+        self._semaphores: dict[str | None, threading.BoundedSemaphore] = {}
+        self._async_semaphores: dict[str | None, asyncio.Semaphore] = {}
+        for key, limit in self._all_limits():
+            if limit.requests_per_second is not None:
+                self._buckets[key] = TokenBucket(limit.requests_per_second, limit.burst)
+            if limit.max_in_flight is not None:
+                self._semaphores[key] = threading.BoundedSemaphore(limit.max_in_flight)
+                self._async_semaphores[key] = asyncio.Semaphore(limit.max_in_flight)
+
+    @contextmanager
+    def limit(self, route: str) -> Iterator[None]:
+        """Wait for a free slot and a token for the route in blocking mode."""
+        keys = self._match(route)
+        with ExitStack() as stack:
+            for key in keys:
+                if key in self._semaphores:
+                    stack.enter_context(self._semaphores[key])
+            delay = self._reserve(keys)
+            if delay > 0:
+                time.sleep(delay)
+            yield
+
+    @asynccontextmanager
+    async def limit_async(self, route: str) -> AsyncIterator[None]:
+        """Wait for a free slot and a token for the route without blocking event loop."""
+        keys = self._match(route)
+        async with AsyncExitStack() as stack:
+            for key in keys:
+                if key in self._async_semaphores:
+                    await stack.enter_async_context(self._async_semaphores[key])
+            delay = self._reserve(keys)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield
+
+    def _all_limits(self) -> list[tuple[str | None, RateLimit]]:
+        limits: list[tuple[str | None, RateLimit]] = [(None, self.rate_limit)] if self.rate_limit else []
+        return limits + list(self.route_rate_limits.items())
+
+    def _match(self, route: str) -> list[str | None]:
+        # Client-wide limit is always acquired first to keep the same order of acquisition in all requests
+        keys: list[str | None] = [None] if self.rate_limit else []
+        route = route.lstrip("/")
+        prefixes = [prefix for prefix in self.route_rate_limits if route == prefix or route.startswith(prefix + "/")]
+        if prefixes:
+            keys.append(max(prefixes, key=len))
+        return keys
+
+    def _reserve(self, keys: list[str | None]) -> float:
+        return max((self._buckets[key].reserve() for key in keys if key in self._buckets), default=0.0)
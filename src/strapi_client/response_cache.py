@@ -0,0 +1,170 @@
+import abc
+import threading
+import time
+from collections import OrderedDict
+from typing import ClassVar, Self
+
+import httpx2
+from pydantic import BaseModel
+
+# Content is stored decoded, so headers describing its encoding on the wire are not stored
+_WIRE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def _strip_wire_headers(headers: httpx2.Headers | dict[str, str]) -> dict[str, str]:
+    return {name: value for name, value in headers.items() if name.lower() not in _WIRE_HEADERS}
+
+
+class CachedResponse(BaseModel):
+    """Response of GET request stored in cache."""
+
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    stored_at: float
+
+    @classmethod
+    def from_response(cls, res: httpx2.Response) -> Self:
+        return cls(
+            status_code=res.status_code,
+            headers=_strip_wire_headers(res.headers),
+            content=res.content,
+            stored_at=time.time(),
+        )
+
+    @property
+    def validation_headers(self) -> dict[str, str]:
+        """Headers of conditional request to revalidate the response."""
+        headers = httpx2.Headers(self.headers)
+        validation_headers: dict[str, str] = {}
+        if etag := headers.get("ETag"):
+            validation_headers["If-None-Match"] = etag
+        if last_modified := headers.get("Last-Modified"):
+            validation_headers["If-Modified-Since"] = last_modified
+        return validation_headers
+
+    def to_response(self, url: str) -> httpx2.Response:
+        return httpx2.Response(
+            self.status_code,
+            headers=_strip_wire_headers(self.headers),
+            content=self.content,
+            request=httpx2.Request("GET", url),
+        )
+
+
+class ResponseCache(abc.ABC):
+    """Base class of response cache backends.
+
+    Entries are fresh during `ttl` seconds after they were stored. After that, stale entries are still served
+    during `stale_while_revalidate` seconds while the client refreshes them in background. Expired entries
+    with `ETag` or `Last-Modified` validators are kept to send conditional requests and served again
+    if the server responds with `304 Not Modified`. Entries store raw response bytes, which are parsed again
+    on every hit.
+    """
+
+    ttl: float
+    stale_while_revalidate: float
+    blocking: ClassVar[bool] = False  # Backend blocks on I/O, so async client calls it in worker threads
+
+    def __init__(self, ttl: float = 60.0, stale_while_revalidate: float = 0.0) -> None:
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+
+    @abc.abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        """Get entry by key.
+
+        Expired entries are returned as well while they have validators, so they can be revalidated
+        with a conditional request.
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store entry by key."""
+
+    @abc.abstractmethod
+    def invalidate(self, route: str) -> None:
+        """Remove entries of the route and all its subroutes, e.g. collection and its documents."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        return time.time() - entry.stored_at < self.ttl
+
+    def is_usable(self, entry: CachedResponse) -> bool:
+        return time.time() - entry.stored_at < self.ttl + self.stale_while_revalidate
+
+    def is_expired(self, entry: CachedResponse) -> bool:
+        return not self.is_usable(entry) and not entry.validation_headers
+
+    @staticmethod
+    def matches_route(key: str, route: str) -> bool:
+        route = route.strip("/")
+        return key == route or key.startswith((route + "/", route + "?", route + "#"))
+
+
+class MemoryCache(ResponseCache):
+    """Thread-safe in-memory response cache with LRU eviction by number of entries and total size."""
+
+    max_entries: int
+    max_bytes: int
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        stale_while_revalidate: float = 0.0,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        super().__init__(ttl=ttl, stale_while_revalidate=stale_while_revalidate)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Total size of cached responses in bytes."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self.is_expired(entry):
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        if len(entry.content) > self.max_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self._size += len(entry.content)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, route: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if self.matches_route(key, route)]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry.content)
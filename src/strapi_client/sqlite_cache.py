@@ -0,0 +1,169 @@
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import ClassVar
+
+from strapi_client.response_cache import CachedResponse, ResponseCache
+
+
+class SQLiteCache(ResponseCache):
+    """Persistent response cache stored in SQLite database file.
+
+    Entries survive restarts of the process and are evicted in least recently used order when total size
+    of stored payloads exceeds `max_bytes`. Payloads are optionally compressed with zlib.
+
+    The file may be shared by processes using different tokens: keys of authenticated responses include
+    a hash of the token, so responses are served only to clients with the same token.
+
+    Calls block on disk I/O and compression, so the async client runs them in worker threads.
+    """
+
+    blocking: ClassVar[bool] = True
+    path: Path
+    max_bytes: int
+    compress: bool
+
+    def __init__(
+        self,
+        path: Path | str,
+        ttl: float = 60.0,
+        stale_while_revalidate: float = 0.0,
+        max_bytes: int = 256 * 1024 * 1024,
+        compress: bool = False,
+    ) -> None:
+        super().__init__(ttl=ttl, stale_while_revalidate=stale_while_revalidate)
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # Total size is maintained by triggers, so writes do not sum sizes over the whole table
+        # and the total stays correct when the file is shared by several processes
+        self._connection.executescript(
+            """
+            BEGIN IMMEDIATE;
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL,
+                compressed INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+            CREATE TABLE IF NOT EXISTS responses_size (id INTEGER PRIMARY KEY CHECK (id = 0), total INTEGER NOT NULL);
+            INSERT OR IGNORE INTO responses_size SELECT 0, COALESCE(SUM(size), 0) FROM responses;
+            CREATE TRIGGER IF NOT EXISTS responses_size_insert AFTER INSERT ON responses BEGIN
+                UPDATE responses_size SET total = total + NEW.size;
+            END;
+            CREATE TRIGGER IF NOT EXISTS responses_size_update AFTER UPDATE OF size ON responses BEGIN
+                UPDATE responses_size SET total = total - OLD.size + NEW.size;
+            END;
+            CREATE TRIGGER IF NOT EXISTS responses_size_delete AFTER DELETE ON responses BEGIN
+                UPDATE responses_size SET total = total - OLD.size;
+            END;
+            COMMIT;
+            """
+        )
+
+    @property
+    def size(self) -> int:
+        """Total size of stored payloads in bytes."""
+        with self._lock:
+            return self._total_size()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status_code, headers, content, compressed, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            status_code, headers, content, compressed, stored_at = row
+            entry = CachedResponse(
+                status_code=status_code,
+                headers=json.loads(headers),
+                content=zlib.decompress(content) if compressed else content,
+                stored_at=stored_at,
+            )
+            if self.is_expired(entry):
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        content = zlib.compress(entry.content) if self.compress else entry.content
+        if len(content) > self.max_bytes:
+            return
+        with self._lock:
+            # Upsert instead of REPLACE, which would delete the old row without firing the size trigger
+            self._connection.execute(
+                """
+                INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    status_code = excluded.status_code,
+                    headers = excluded.headers,
+                    content = excluded.content,
+                    compressed = excluded.compressed,
+                    size = excluded.size,
+                    stored_at = excluded.stored_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (
+                    key,
+                    entry.status_code,
+                    json.dumps(entry.headers),
+                    content,
+                    int(self.compress),
+                    len(content),
+                    entry.stored_at,
+                    time.time(),
+                ),
+            )
+            self._evict()
+
+    def invalidate(self, route: str) -> None:
+        route = route.strip("/")
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM responses WHERE key = ? OR substr(key, 1, ?) IN (?, ?, ?)",
+                (route, len(route) + 1, route + "/", route + "?", route + "#"),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _total_size(self) -> int:
+        return self._connection.execute("SELECT total FROM responses_size").fetchone()[0]
+
+    def _evict(self) -> None:
+        total_size = self._total_size()
+        if total_size <= self.max_bytes:
+            return
+        # Rows are read lazily by index, only until enough least recently used entries are found
+        keys_to_remove = []
+        cursor = self._connection.execute("SELECT key, size FROM responses ORDER BY accessed_at")
+        for key, size in cursor:
+            if total_size <= self.max_bytes:
+                break
+            keys_to_remove.append((key,))
+            total_size -= size
+        cursor.close()
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", keys_to_remove)
@@ -1,24 +1,41 @@
+import itertools
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from functools import partial
 from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 from urllib.parse import urljoin
 
 import httpx2
 from pydantic import BaseModel
 
+from strapi_client.adaptive_batch_size import AdaptiveBatchSize
 from strapi_client.models.api_parameters import ApiParameters
 from strapi_client.models.auth import AuthPayload, AuthResponse
+from strapi_client.models.bulk_result import BulkItemResult, BulkResult
 from strapi_client.models.file_payload import FilePayload
 from strapi_client.models.media_image_document import MediaImageDocument
+from strapi_client.models.query_plan import QueryPlan
 from strapi_client.models.response import DocumentResponse, DocumentsResponse
+from strapi_client.response_cache import CachedResponse
 from strapi_client.strapi_client_base import StrapiClientBase
+from strapi_client.types import PaginationMode
 from strapi_client.utils import serialize_document_data
 
+BulkOperation = Callable[[], DocumentResponse | None]
+
 
 class StrapiClient(StrapiClientBase):
     """REST API client for Strapi."""
 
+    transport: httpx2.BaseTransport | None = None
     _client: httpx2.Client | None = None
+    _in_flight: dict[str, Future[httpx2.Response]]
 
     def __enter__(self):
         self.open()
@@ -30,7 +47,7 @@ class StrapiClient(StrapiClientBase):
     def open(self) -> httpx2.Client:
         # Fallback to creating a client if not used in a context manager.
         if self._client is None:
-            self._client = httpx2.Client(timeout=self.timeout)
+            self._client = httpx2.Client(transport=self.transport, **self._client_options)
         return self._client
 
     def close(self):
@@ -53,12 +70,12 @@ class StrapiClient(StrapiClientBase):
         res = self.send_post_request(
             "auth/local", json=AuthPayload(identifier=identifier, password=password).model_dump(), use_auth=False
         )
-        self._token = AuthResponse.model_validate(res.json()).jwt
+        self._token = AuthResponse.model_validate_json(res.content).jwt
 
     def get_single_document(self, single_api_id: str) -> DocumentResponse:
         """Get document of single type."""
         res = self.send_get_request(single_api_id)
-        return DocumentResponse.model_validate(res.json())
+        return DocumentResponse.model_validate_json(res.content)
 
     def get_document(
         self,
@@ -67,11 +84,12 @@ class StrapiClient(StrapiClientBase):
         populate: list[str] | dict[str, Any] | str | None = None,
         fields: list[str] | None = None,
         locale: str | None = None,
+        query_plan: QueryPlan | None = None,
     ) -> DocumentResponse:
-        """Get document by document id."""
-        params = ApiParameters(populate=populate, fields=fields, locale=locale)
+        """Get document by document id. Query plan, if provided, is used instead of populate and fields."""
+        params = ApiParameters(populate=populate, fields=fields, locale=locale).with_query_plan(query_plan)
         res = self.send_get_request(f"{plural_api_id}/{document_id}", params=params.stringify())
-        return DocumentResponse.model_validate(res.json())
+        return DocumentResponse.model_validate_json(res.content)
 
     def get_documents(
         self,
@@ -84,47 +102,268 @@ class StrapiClient(StrapiClientBase):
         locale: str | None = None,
         start: int | None = None,
         page: int | None = None,
-        batch_size: int = 25,
+        batch_size: int | Literal["auto"] = 25,
         with_count: bool = True,
+        max_concurrency: int = 1,
+        pagination_mode: PaginationMode = "offset",
+        keyset_field: str = "id",
+        query_plan: QueryPlan | None = None,
     ) -> DocumentsResponse:
-        """Get list of documents. By default, operates in batch mode to get all documents automatically."""
+        """Get list of documents. By default, operates in batch mode to get all documents automatically.
+
+        In batch mode, pages after the first one are requested by a pool of up to `max_concurrency` threads
+        sharing the client connection pool, and reassembled in offset order.
+
+        With `pagination_mode="keyset"`, pages are sorted by unique monotonic `keyset_field` and each next page
+        is requested after the last received value instead of a deep offset, until a short page is returned.
+
+        With `pagination_mode="count_free"`, total count is never requested and pages are requested until a short
+        page is returned, so `meta.pagination.total` is not available in the result.
+
+        With `batch_size="auto"`, pages are requested sequentially and page size is adapted to response time and
+        size within the page size limit of the server.
+
+        Query plan, if provided, is used instead of `populate` and `fields` to skip their encoding.
+        """
+        self._check_pagination_arguments(batch_size, max_concurrency, pagination_mode)
+        page_size = batch_size if isinstance(batch_size, int) else None
+        if page_size is None and (page is not None or start is not None):
+            raise ValueError("Adaptive batch size is available only when getting all documents")
         params = ApiParameters(
             sort=sort,
             filters=filters,
             populate=populate,
             fields=fields,
             page=page,
-            page_size=batch_size,
+            page_size=page_size,
             start=start,
-            limit=batch_size,
+            limit=page_size,
             publication_state=publication_state,
             locale=locale,
-        )
+        ).with_query_plan(query_plan)
         if params.page is not None or params.start is not None:  # Get specific page/batch
             res = self.send_get_request(plural_api_id, params=params.stringify())
-            return DocumentsResponse.model_validate(res.json())
+            return DocumentsResponse.model_validate_json(res.content)
         else:  # Get all records
-            params.start = 0
-            params.with_count = True
-            res = self.send_get_request(plural_api_id, params=params.stringify())
-            res_page = DocumentsResponse.model_validate(res.json())
-            start_list = [i for i in range(batch_size, res_page.meta.get_total_count(), batch_size)]
-            all_data = res_page
-            for cur_start in start_list:
-                params.start = cur_start
-                params.with_count = with_count
-                res = self.send_get_request(plural_api_id, params=params.stringify())
-                res_page = DocumentsResponse.model_validate(res.json())
+            pages = self._iter_pages(
+                plural_api_id, params, batch_size, with_count, max_concurrency, pagination_mode, keyset_field
+            )
+            all_data = next(pages)
+            for res_page in pages:
                 all_data.data += res_page.data
                 all_data.meta = res_page.meta
             return all_data
 
+    def iter_pages(
+        self,
+        plural_api_id: str,
+        sort: list[str] | None = None,
+        filters: dict[str, Any] | None = None,
+        populate: list[str] | dict[str, Any] | str | None = None,
+        fields: list[str] | None = None,
+        publication_state: str | None = None,
+        locale: str | None = None,
+        batch_size: int | Literal["auto"] = 25,
+        with_count: bool = True,
+        max_concurrency: int = 1,
+        pagination_mode: PaginationMode = "offset",
+        keyset_field: str = "id",
+        query_plan: QueryPlan | None = None,
+    ) -> Iterator[DocumentsResponse]:
+        """Iterate over all pages of documents.
+
+        Up to `max_concurrency` next pages are requested ahead by a thread pool while the current page
+        is being processed. See `get_documents` for the available pagination modes.
+        """
+        self._check_pagination_arguments(batch_size, max_concurrency, pagination_mode)
+        params = ApiParameters(
+            sort=sort,
+            filters=filters,
+            populate=populate,
+            fields=fields,
+            limit=batch_size if isinstance(batch_size, int) else None,
+            publication_state=publication_state,
+            locale=locale,
+        ).with_query_plan(query_plan)
+        yield from self._iter_pages(
+            plural_api_id, params, batch_size, with_count, max_concurrency, pagination_mode, keyset_field
+        )
+
+    def iter_documents(
+        self,
+        plural_api_id: str,
+        sort: list[str] | None = None,
+        filters: dict[str, Any] | None = None,
+        populate: list[str] | dict[str, Any] | str | None = None,
+        fields: list[str] | None = None,
+        publication_state: str | None = None,
+        locale: str | None = None,
+        batch_size: int | Literal["auto"] = 25,
+        with_count: bool = True,
+        max_concurrency: int = 1,
+        pagination_mode: PaginationMode = "offset",
+        keyset_field: str = "id",
+        query_plan: QueryPlan | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all documents page by page."""
+        for res_page in self.iter_pages(
+            plural_api_id,
+            sort=sort,
+            filters=filters,
+            populate=populate,
+            fields=fields,
+            publication_state=publication_state,
+            locale=locale,
+            batch_size=batch_size,
+            with_count=with_count,
+            max_concurrency=max_concurrency,
+            pagination_mode=pagination_mode,
+            keyset_field=keyset_field,
+            query_plan=query_plan,
+        ):
+            yield from res_page.data
+
+    def _iter_pages(
+        self,
+        plural_api_id: str,
+        params: ApiParameters,
+        batch_size: int | Literal["auto"],
+        with_count: bool,
+        max_concurrency: int,
+        pagination_mode: PaginationMode,
+        keyset_field: str,
+    ) -> Iterator[DocumentsResponse]:
+        if not isinstance(batch_size, int):
+            yield from self._iter_adaptive_pages(plural_api_id, params, with_count, pagination_mode, keyset_field)
+        elif pagination_mode == "keyset":
+            yield from self._iter_keyset_pages(plural_api_id, params, batch_size, keyset_field)
+        else:
+            yield from self._iter_offset_pages(
+                plural_api_id, params, batch_size, with_count, max_concurrency, pagination_mode == "count_free"
+            )
+
+    def _iter_adaptive_pages(
+        self,
+        plural_api_id: str,
+        params: ApiParameters,
+        with_count: bool,
+        pagination_mode: PaginationMode,
+        keyset_field: str,
+    ) -> Iterator[DocumentsResponse]:
+        batch_sizer = AdaptiveBatchSize()
+        start = 0
+        total: int | None = None
+        last_value: Any | None = None
+        while True:
+            limit = batch_sizer.batch_size
+            if pagination_mode == "keyset":
+                page_params = params.keyset_page(keyset_field, last_value).model_copy(update={"limit": limit})
+            else:
+                page_with_count = pagination_mode == "offset" and (start == 0 or with_count)
+                page_params = params.model_copy(update={"start": start, "limit": limit, "with_count": page_with_count})
+            started_at = time.perf_counter()
+            res = self.send_get_request(plural_api_id, params=page_params.stringify())
+            res_page = DocumentsResponse.model_validate_json(res.content)
+            batch_sizer.record(
+                len(res_page.data), len(res.content), time.perf_counter() - started_at, res_page.meta.pagination.limit
+            )
+            yield res_page
+            # Offsets follow received documents, so a page clamped by the server does not skip any of them
+            start += len(res_page.data)
+            if pagination_mode == "offset":
+                if total is None:
+                    total = res_page.meta.get_total_count()
+                if start >= total or not res_page.data:
+                    return
+            elif self._is_last_page(res_page, limit):
+                return
+            elif pagination_mode == "keyset":
+                last_value = self._get_keyset_value(res_page, keyset_field)
+
+    def _iter_keyset_pages(
+        self, plural_api_id: str, params: ApiParameters, batch_size: int, keyset_field: str
+    ) -> Iterator[DocumentsResponse]:
+        last_value: Any | None = None
+        while True:
+            res_page = self._get_documents_page(plural_api_id, params.keyset_page(keyset_field, last_value), 0, False)
+            yield res_page
+            if self._is_last_page(res_page, batch_size):
+                return
+            last_value = self._get_keyset_value(res_page, keyset_field)
+
+    def _iter_offset_pages(
+        self,
+        plural_api_id: str,
+        params: ApiParameters,
+        batch_size: int,
+        with_count: bool,
+        max_concurrency: int,
+        count_free: bool,
+    ) -> Iterator[DocumentsResponse]:
+        first_page = self._get_documents_page(plural_api_id, params, 0, not count_free)
+        start_list: Iterator[int]
+        if count_free:
+            # Total count is never requested, so next offsets are requested until a short page is returned
+            self._check_page_limit(first_page, batch_size)
+            with_count = False
+            if self._is_last_page(first_page, batch_size):
+                start_list = iter(())
+            else:
+                start_list = itertools.count(batch_size, batch_size)
+        else:
+            start_list = iter(range(batch_size, first_page.meta.get_total_count(), batch_size))
+        if max_concurrency == 1:
+            yield first_page
+            for cur_start in start_list:
+                res_page = self._get_documents_page(plural_api_id, params, cur_start, with_count)
+                yield res_page
+                if count_free and self._is_last_page(res_page, batch_size):
+                    return
+            return
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        pending: deque[tuple[int, Future[DocumentsResponse]]] = deque()
+
+        def schedule() -> None:
+            while len(pending) < max_concurrency and (cur_start := next(start_list, None)) is not None:
+                pending.append(
+                    (
+                        cur_start,
+                        executor.submit(self._get_documents_page, plural_api_id, params, cur_start, with_count),
+                    )
+                )
+
+        try:
+            schedule()
+            yield first_page
+            while pending:
+                cur_start, future = pending.popleft()
+                try:
+                    res_page = future.result()
+                except Exception as e:
+                    raise RuntimeError(f"Unable to get documents at offset {cur_start}: {e}") from e
+                if count_free and self._is_last_page(res_page, batch_size):
+                    yield res_page
+                    return
+                schedule()
+                yield res_page
+        finally:
+            # Do not request remaining pages after a failure or early exit
+            executor.shutdown(cancel_futures=True)
+
+    def _get_documents_page(
+        self, plural_api_id: str, params: ApiParameters, start: int, with_count: bool
+    ) -> DocumentsResponse:
+        page_params = params.model_copy(update={"start": start, "with_count": with_count})
+        res = self.send_get_request(plural_api_id, params=page_params.stringify())
+        return DocumentsResponse.model_validate_json(res.content)
+
     def create_or_update_single_document(
         self, single_api_id: str, data: dict[str, Any] | BaseModel
     ) -> DocumentResponse:
         """Create or update single type document."""
         res = self.send_put_request(single_api_id, body={"data": serialize_document_data(data)})
-        return DocumentResponse.model_validate(res.json())
+        self._invalidate_cache(single_api_id)
+        return DocumentResponse.model_validate_json(res.content)
 
     def create_document(self, plural_api_id: str, data: dict[str, Any] | BaseModel) -> DocumentResponse:
         """Create new document."""
@@ -132,7 +371,8 @@ class StrapiClient(StrapiClientBase):
             plural_api_id,
             json={"data": serialize_document_data(data)},
         )
-        return DocumentResponse.model_validate(res.json())
+        self._invalidate_cache(plural_api_id)
+        return DocumentResponse.model_validate_json(res.content)
 
     def update_document(
         self, plural_api_id: str, document_id: str, data: dict[str, Any] | BaseModel
@@ -142,29 +382,157 @@ class StrapiClient(StrapiClientBase):
             f"{plural_api_id}/{document_id}",
             body={"data": serialize_document_data(data)},
         )
-        return DocumentResponse.model_validate(res.json())
+        self._invalidate_cache(plural_api_id)
+        return DocumentResponse.model_validate_json(res.content)
 
     def delete_single_document(self, single_api_id: str) -> None:
         """Delete single type document."""
         self.send_delete_request(single_api_id)
+        self._invalidate_cache(single_api_id)
 
     def delete_document(self, plural_api_id: str, document_id: str) -> None:
         """Delete document by document id."""
         self.send_delete_request(f"{plural_api_id}/{document_id}")
+        self._invalidate_cache(plural_api_id)
+
+    def create_documents(
+        self, plural_api_id: str, data: list[dict[str, Any] | BaseModel], max_concurrency: int = 4
+    ) -> BulkResult:
+        """Create several documents with up to `max_concurrency` parallel requests.
+
+        Failed documents do not stop other ones and are reported in the result in input order.
+        """
+        return self._run_bulk(
+            [(None, partial(self.create_document, plural_api_id, item)) for item in data], max_concurrency
+        )
+
+    def update_documents(
+        self, plural_api_id: str, data: dict[str, dict[str, Any] | BaseModel], max_concurrency: int = 4
+    ) -> BulkResult:
+        """Update several documents by document ids with up to `max_concurrency` parallel requests.
+
+        Failed documents do not stop other ones and are reported in the result in input order.
+        """
+        return self._run_bulk(
+            [
+                (document_id, partial(self.update_document, plural_api_id, document_id, item))
+                for document_id, item in data.items()
+            ],
+            max_concurrency,
+        )
+
+    def delete_documents(self, plural_api_id: str, document_ids: list[str], max_concurrency: int = 4) -> BulkResult:
+        """Delete several documents by document ids with up to `max_concurrency` parallel requests.
+
+        Failed documents do not stop other ones and are reported in the result in input order.
+        """
+        return self._run_bulk(
+            [(document_id, partial(self.delete_document, plural_api_id, document_id)) for document_id in document_ids],
+            max_concurrency,
+        )
+
+    def _run_bulk(self, operations: list[tuple[str | None, BulkOperation]], max_concurrency: int) -> BulkResult:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than or equal to 1")
+
+        def run(index: int, document_id: str | None, operation: BulkOperation) -> BulkItemResult:
+            try:
+                response = operation()
+            except (RuntimeError, ValueError, httpx2.HTTPError) as e:
+                return BulkItemResult(index=index, document_id=document_id, error=str(e))
+            return self._get_bulk_item_result(index, document_id, response)
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [executor.submit(run, i, document_id, op) for i, (document_id, op) in enumerate(operations)]
+            return BulkResult(items=[future.result() for future in futures])
 
     def send_get_request(
         self,
         route: str,
         params: dict[str, Any] | str | None = None,
         use_auth: bool = True,
+        use_cache: bool = True,
     ) -> httpx2.Response:
-        """Send GET request to custom endpoint."""
-        res = self.client.get(
-            url=urljoin(self.api_url, route), params=params, headers=self._auth_header if use_auth else None
+        """Send GET request to custom endpoint.
+
+        Response is served from cache of the client when available. Identical requests sent concurrently
+        from several threads share a single request to the server and its response.
+        """
+        key = self._get_cache_key(route, params, use_auth)
+        entry = self.cache.get(key) if self.cache is not None and use_cache else None
+        if entry is not None and self.cache is not None and self.cache.is_usable(entry):
+            if not self.cache.is_fresh(entry):
+                self._revalidate_in_background(key, route, params, use_auth, entry)
+            return entry.to_response(urljoin(self.api_url, route))
+        with self._in_flight_lock:
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                future: Future[httpx2.Response] = Future()
+                self._in_flight[key] = future
+        if in_flight is not None:
+            return in_flight.result()
+        try:
+            if self.cache is None or not use_cache:
+                res = self._send_request("GET", route, use_auth=use_auth, params=params)
+            else:
+                res = self._send_cached_get_request(key, route, params, use_auth, entry)
+        except BaseException as e:
+            self._finish_in_flight(key, future)
+            future.set_exception(e)
+            raise
+        self._finish_in_flight(key, future)
+        future.set_result(res)
+        return res
+
+    def _finish_in_flight(self, key: str, future: Future[httpx2.Response]) -> None:
+        with self._in_flight_lock:
+            # Request may have been dropped by a write and replaced with a newer one
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def _send_cached_get_request(
+        self,
+        key: str,
+        route: str,
+        params: dict[str, Any] | str | None,
+        use_auth: bool,
+        entry: CachedResponse | None = None,
+    ) -> httpx2.Response:
+        """Send GET request and store response in cache, revalidating the cached entry when possible.
+
+        On `304 Not Modified` the cached bytes are returned as a new response, so the body is not transferred
+        but is parsed again by the caller. Parsed models are not cached because they are mutable and would be
+        shared between callers.
+        """
+        headers = entry.validation_headers if entry else {}
+        invalidation_count = self._invalidation_count
+        res = self._send_request(
+            "GET", route, use_auth=use_auth, params=params, headers=headers, accept_not_modified=bool(headers)
         )
-        self._check_response(res, "Unable to send GET request")
+        if res.status_code == 304 and entry is not None:
+            # Content is not modified since it was cached, so cached response is refreshed and served
+            entry = entry.model_copy(update={"stored_at": time.time()})
+            self._set_cache_entry(key, entry, invalidation_count)
+            return entry.to_response(urljoin(self.api_url, route))
+        self._set_cache_entry(key, CachedResponse.from_response(res), invalidation_count)
         return res
 
+    def _revalidate_in_background(
+        self, key: str, route: str, params: dict[str, Any] | str | None, use_auth: bool, entry: CachedResponse
+    ) -> None:
+        if self._start_revalidation(key):
+            threading.Thread(target=self._revalidate, args=(key, route, params, use_auth, entry), daemon=True).start()
+
+    def _revalidate(
+        self, key: str, route: str, params: dict[str, Any] | str | None, use_auth: bool, entry: CachedResponse
+    ) -> None:
+        try:
+            self._send_cached_get_request(key, route, params, use_auth, entry)
+        except (RuntimeError, httpx2.HTTPError):
+            pass  # Stale entry is served until it expires
+        finally:
+            self._finish_revalidation(key)
+
     def send_put_request(
         self,
         route: str,
@@ -173,11 +541,7 @@ class StrapiClient(StrapiClientBase):
         use_auth: bool = True,
     ) -> httpx2.Response:
         """Send PUT request to custom endpoint."""
-        res = self.client.put(
-            url=urljoin(self.api_url, route), json=body, params=params, headers=self._auth_header if use_auth else None
-        )
-        self._check_response(res, "Unable to send PUT request")
-        return res
+        return self._send_request("PUT", route, use_auth=use_auth, json=body, params=params)
 
     def send_post_request(
         self,
@@ -189,22 +553,48 @@ class StrapiClient(StrapiClientBase):
         use_auth: bool = True,
     ) -> httpx2.Response:
         """Send POST request to custom endpoint."""
-        res = self.client.post(
-            url=urljoin(self.api_url, route),
-            json=json,
-            params=params,
-            data=data,
-            files=files,
-            headers=self._auth_header if use_auth else None,
-        )
-        self._check_response(res, "Unable to send POST request")
-        return res
+        return self._send_request("POST", route, use_auth=use_auth, json=json, params=params, data=data, files=files)
 
     def send_delete_request(self, route: str, use_auth: bool = True) -> httpx2.Response:
         """Send DELETE request to custom endpoint."""
-        res = self.client.delete(url=urljoin(self.api_url, route), headers=self._auth_header if use_auth else None)
-        self._check_response(res, "Unable to send DELETE request")
-        return res
+        return self._send_request("DELETE", route, use_auth=use_auth)
+
+    def _send_request(
+        self,
+        method: str,
+        route: str,
+        use_auth: bool = True,
+        headers: dict[str, str] | None = None,
+        accept_not_modified: bool = False,
+        **kwargs: Any,
+    ) -> httpx2.Response:
+        """Send request and retry it according to retry policy of the client."""
+        url = urljoin(self.api_url, route)
+        headers = {**(self._auth_header if use_auth else {}), **(headers or {})}
+        if kwargs.get("json") is not None:
+            # Body is encoded once with codec of the client and reused by retries
+            kwargs["content"] = self.json_codec.dumps(kwargs.pop("json"))
+            headers["Content-Type"] = "application/json"
+        attempt = 0
+        while True:
+            try:
+                with self._limit_request(route):
+                    res = self.client.request(method, url, headers=headers, **kwargs)
+            except httpx2.TransportError:
+                delay = self._get_retry_delay(method, attempt, None)
+                if delay is None:
+                    raise
+            else:
+                delay = self._get_retry_delay(method, attempt, res)
+                if delay is None:
+                    if not (accept_not_modified and res.status_code == 304):
+                        self._check_response(res, f"Unable to send {method} request")
+                    return res
+            time.sleep(delay)
+            attempt += 1
+
+    def _limit_request(self, route: str) -> AbstractContextManager[None]:
+        return self.rate_limiter.limit(route) if self.rate_limiter else nullcontext()
 
     def upload_files(
         self,
@@ -220,7 +610,7 @@ class StrapiClient(StrapiClientBase):
             data = {"ref": content_type_id, "refId": document_id, "field": field}
         res = self.send_post_request("upload", data=data, files=[fp.to_files_tuple() for fp in file_payloads])
         self._check_response(res, "Unable to send POST request")
-        return [MediaImageDocument.model_validate(d) for d in (res.json() or [])]
+        return MediaImageDocument.from_list_json(res.content or b"[]")
 
     def upload_file(
         self,
@@ -250,7 +640,7 @@ class StrapiClient(StrapiClientBase):
         """Get uploaded files."""
         params = ApiParameters(filters=filters)
         res = self.send_get_request("upload/files", params=params.stringify())
-        return res.json()
+        return self.json_codec.loads(res.content)
 
     def check_health(self) -> bool:
         """Check if Strapi API is available."""
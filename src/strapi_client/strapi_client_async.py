@@ -1,24 +1,113 @@
+import asyncio
+import itertools
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import AbstractAsyncContextManager, nullcontext
+from functools import partial
 from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal, TypeVar
 from urllib.parse import urljoin
 
 import httpx2
 from pydantic import BaseModel
 
+from strapi_client.adaptive_batch_size import AdaptiveBatchSize
+from strapi_client.concurrency_controller import ConcurrencyController
+from strapi_client.document_loader import DocumentLoader
+from strapi_client.json_codec import JsonCodec
+from strapi_client.models.adaptive_concurrency import AdaptiveConcurrency
 from strapi_client.models.api_parameters import ApiParameters
 from strapi_client.models.auth import AuthPayload, AuthResponse
+from strapi_client.models.bulk_result import BulkItemResult, BulkResult
+from strapi_client.models.cooperative_validation import CooperativeValidation
 from strapi_client.models.file_payload import FilePayload
 from strapi_client.models.media_image_document import MediaImageDocument
-from strapi_client.models.response import DocumentResponse, DocumentsResponse
+from strapi_client.models.page_validation import get_documents_response_type
+from strapi_client.models.query_plan import QueryPlan
+from strapi_client.models.rate_limit import RateLimit
+from strapi_client.models.response import (
+    DocumentResponse,
+    DocumentsPageMeta,
+    DocumentsResponse,
+    TypedDocumentsResponse,
+)
+from strapi_client.models.retry_policy import RetryPolicy
+from strapi_client.response_cache import CachedResponse, ResponseCache
 from strapi_client.strapi_client_base import StrapiClientBase
+from strapi_client.types import PaginationMode
 from strapi_client.utils import serialize_document_data
 
+BulkOperation = Callable[[], Awaitable[DocumentResponse | None]]
+DocumentType = TypeVar("DocumentType", bound=BaseModel)
+T = TypeVar("T")
+PageType = TypeVar("PageType", DocumentsResponse, TypedDocumentsResponse[Any])
+
 
 class StrapiClientAsync(StrapiClientBase):
     """Async REST API client for Strapi."""
 
+    transport: httpx2.AsyncBaseTransport | None = None
+    concurrency_controller: ConcurrencyController | None = None
+    cooperative_validation: CooperativeValidation | None = None
+    loader: DocumentLoader
     _client: httpx2.AsyncClient | None = None
+    _in_flight: dict[str, asyncio.Future[httpx2.Response]]
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str | None = None,
+        timeout: httpx2.Timeout | None = None,
+        limits: httpx2.Limits | None = None,
+        http2: bool = False,
+        transport: httpx2.AsyncBaseTransport | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limit: RateLimit | None = None,
+        route_rate_limits: dict[str, RateLimit] | None = None,
+        cache: ResponseCache | None = None,
+        json_codec: JsonCodec | None = None,
+        adaptive_concurrency: AdaptiveConcurrency | None = None,
+        cooperative_validation: CooperativeValidation | None = None,
+    ) -> None:
+        """Initialize client.
+
+        Documents requested with `loader` are batched into `filters[documentId][$in]` queries.
+
+        Args:
+            base_url: URL of Strapi instance.
+            token: API token.
+            timeout: Request timeout configuration.
+            limits: Connection pool size and keep-alive expiry, e.g. to allow concurrent batch requests.
+            http2: Enable HTTP/2 multiplexing, requires `httpx2[http2]` to be installed.
+            transport: Custom transport to send requests with.
+            retry_policy: Policy of retrying failed requests, requests are not retried by default.
+            rate_limit: Limit of request rate and requests in flight for all requests of the client.
+            route_rate_limits: Additional limits for requests by route prefix, e.g. `{"upload": RateLimit(...)}`.
+            cache: Cache of GET responses, invalidated by writes of the client to the same collection.
+            json_codec: Codec of JSON request bodies and responses, standard library json is used by default.
+            adaptive_concurrency: Adaptive limit of concurrent requests driven by latency and errors.
+            cooperative_validation: Validation of large pages without blocking the event loop.
+        """
+        super().__init__(
+            base_url=base_url,
+            token=token,
+            timeout=timeout,
+            limits=limits,
+            http2=http2,
+            transport=transport,
+            retry_policy=retry_policy,
+            rate_limit=rate_limit,
+            route_rate_limits=route_rate_limits,
+            cache=cache,
+            json_codec=json_codec,
+        )
+        self.cooperative_validation = cooperative_validation
+        self.loader = DocumentLoader(self)
+        if adaptive_concurrency:
+            self.concurrency_controller = ConcurrencyController(adaptive_concurrency)
+        self._revalidation_tasks: set[asyncio.Future[None]] = set()
 
     async def __aenter__(self):
         self.open()
@@ -30,7 +119,7 @@ class StrapiClientAsync(StrapiClientBase):
     def open(self) -> httpx2.AsyncClient:
         # Fallback to creating a client if not used in a context manager.
         if self._client is None:
-            self._client = httpx2.AsyncClient(timeout=self.timeout)
+            self._client = httpx2.AsyncClient(transport=self.transport, **self._client_options)
         return self._client
 
     async def close(self):
@@ -53,12 +142,12 @@ class StrapiClientAsync(StrapiClientBase):
         res = await self.send_post_request(
             "auth/local", json=AuthPayload(identifier=identifier, password=password).model_dump(), use_auth=False
         )
-        self._token = AuthResponse.model_validate(res.json()).jwt
+        self._token = AuthResponse.model_validate_json(res.content).jwt
 
     async def get_single_document(self, single_api_id: str) -> DocumentResponse:
         """Get document of single type."""
         res = await self.send_get_request(single_api_id)
-        return DocumentResponse.model_validate(res.json())
+        return DocumentResponse.model_validate_json(res.content)
 
     async def get_document(
         self,
@@ -67,11 +156,25 @@ class StrapiClientAsync(StrapiClientBase):
         populate: list[str] | dict[str, Any] | str | None = None,
         fields: list[str] | None = None,
         locale: str | None = None,
+        query_plan: QueryPlan | None = None,
     ) -> DocumentResponse:
-        """Get document by document id."""
-        params = ApiParameters(populate=populate, fields=fields, locale=locale)
+        """Get document by document id. Query plan, if provided, is used instead of populate and fields."""
+        content = await self.get_raw_document(plural_api_id, document_id, populate, fields, locale, query_plan)
+        return DocumentResponse.model_validate_json(content)
+
+    async def get_raw_document(
+        self,
+        plural_api_id: str,
+        document_id: str,
+        populate: list[str] | dict[str, Any] | str | None = None,
+        fields: list[str] | None = None,
+        locale: str | None = None,
+        query_plan: QueryPlan | None = None,
+    ) -> bytes:
+        """Get raw content of document response, e.g. to validate it directly into a document model."""
+        params = ApiParameters(populate=populate, fields=fields, locale=locale).with_query_plan(query_plan)
         res = await self.send_get_request(f"{plural_api_id}/{document_id}", params=params.stringify())
-        return DocumentResponse.model_validate(res.json())
+        return res.content
 
     async def get_documents(
         self,
@@ -84,47 +187,397 @@ class StrapiClientAsync(StrapiClientBase):
         locale: str | None = None,
         start: int | None = None,
         page: int | None = None,
-        batch_size: int = 25,
+        batch_size: int | Literal["auto"] = 25,
         with_count: bool = True,
+        max_concurrency: int = 1,
+        pagination_mode: PaginationMode = "offset",
+        keyset_field: str = "id",
+        query_plan: QueryPlan | None = None,
     ) -> DocumentsResponse:
-        """Get list of documents. By default, operates in batch mode to get all documents automatically."""
+        """Get list of documents. By default, operates in batch mode to get all documents automatically.
+
+        In batch mode, pages after the first one are requested with up to `max_concurrency` parallel requests
+        and reassembled in offset order.
+
+        With `pagination_mode="keyset"`, pages are sorted by unique monotonic `keyset_field` and each next page
+        is requested after the last received value instead of a deep offset, until a short page is returned.
+
+        With `pagination_mode="count_free"`, total count is never requested and pages are requested until a short
+        page is returned, so `meta.pagination.total` is not available in the result.
+
+        With `batch_size="auto"`, pages are requested sequentially and page size is adapted to response time and
+        size within the page size limit of the server.
+
+        Query plan, if provided, is used instead of `populate` and `fields` to skip their encoding.
+        """
+        pages = self._get_pages(
+            DocumentsResponse,
+            plural_api_id,
+            ApiParameters(
+                sort=sort,
+                filters=filters,
+                populate=populate,
+                fields=fields,
+                page=page,
+                start=start,
+                publication_state=publication_state,
+                locale=locale,
+            ),
+            batch_size,
+            with_count,
+            max_concurrency,
+            pagination_mode,
+            keyset_field,
+            query_plan,
+        )
+        all_data = await anext(pages)
+        async for res_page in pages:
+            all_data.data += res_page.data
+            all_data.meta = res_page.meta
+        return all_data
+
+    async def iter_pages(
+        self,
+        plural_api_id: str,
+        sort: list[str] | None = None,
+        filters: dict[str, Any] | None = None,
+        populate: list[str] | dict[str, Any] | str | None = None,
+        fields: list[str] | None = None,
+        publication_state: str | None = None,
+        locale: str | None = None,
+        batch_size: int | Literal["auto"] = 25,
+        with_count: bool = True,
+        max_concurrency: int = 1,
+        pagination_mode: PaginationMode = "offset",
+        keyset_field: str = "id",
+        query_plan: QueryPlan | None = None,
+        start: int | None = None,
+        page: int | None = None,
+    ) -> AsyncIterator[DocumentsResponse]:
+        """Iterate over all pages of documents, or over the specified page only if `start` or `page` is set.
+
+        Up to `max_concurrency` next pages are requested ahead while the current page is being processed.
+        See `get_documents` for the available pagination modes.
+        """
+        async for res_page in self._get_pages(
+            DocumentsResponse,
+            plural_api_id,
+            ApiParameters(
+                sort=sort,
+                filters=filters,
+                populate=populate,
+                fields=fields,
+                page=page,
+                start=start,
+                publication_state=publication_state,
+                locale=locale,
+            ),
+            batch_size,
+            with_count,
+            max_concurrency,
+            pagination_mode,
+            keyset_field,
+            query_plan,
+        ):
+            yield res_page
+
+    async def iter_model_pages(
+        self,
+        model_class: type[DocumentType],
+        plural_api_id: str,
+        sort: list[str] | None = None,
+        filters: dict[str, Any] | None = None,
+        publication_state: str | None = None,
+        locale: str | None = None,
+        batch_size: int | Literal["auto"] = 25,
+        with_count: bool = True,
+        max_concurrency: int = 1,
+        pagination_mode: PaginationMode = "offset",
+        keyset_field: str = "id",
+        query_plan: QueryPlan | None = None,
+        start: int | None = None,
+        page: int | None = None,
+    ) -> AsyncIterator[TypedDocumentsResponse[DocumentType]]:
+        """Iterate over pages of documents validated directly from response content into the model class.
+
+        Documents are built without intermediate dicts of `DocumentsResponse`. With `start` or `page`, only
+        the specified page is returned. Fields and populate are taken from the query plan, if provided.
+        See `get_documents` for the available pagination modes.
+        """
+        async for res_page in self._get_pages(
+            get_documents_response_type(model_class),
+            plural_api_id,
+            ApiParameters(
+                sort=sort, filters=filters, page=page, start=start, publication_state=publication_state, locale=locale
+            ),
+            batch_size,
+            with_count,
+            max_concurrency,
+            pagination_mode,
+            keyset_field,
+            query_plan,
+        ):
+            yield res_page
+
+    async def iter_documents(
+        self,
+        plural_api_id: str,
+        sort: list[str] | None = None,
+        filters: dict[str, Any] | None = None,
+        populate: list[str] | dict[str, Any] | str | None = None,
+        fields: list[str] | None = None,
+        publication_state: str | None = None,
+        locale: str | None = None,
+        batch_size: int | Literal["auto"] = 25,
+        with_count: bool = True,
+        max_concurrency: int = 1,
+        pagination_mode: PaginationMode = "offset",
+        keyset_field: str = "id",
+        query_plan: QueryPlan | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over all documents page by page."""
+        async for res_page in self.iter_pages(
+            plural_api_id,
+            sort=sort,
+            filters=filters,
+            populate=populate,
+            fields=fields,
+            publication_state=publication_state,
+            locale=locale,
+            batch_size=batch_size,
+            with_count=with_count,
+            max_concurrency=max_concurrency,
+            pagination_mode=pagination_mode,
+            keyset_field=keyset_field,
+            query_plan=query_plan,
+        ):
+            for document in res_page.data:
+                yield document
+
+    async def iter_raw_pages(
+        self,
+        plural_api_id: str,
+        sort: list[str] | None = None,
+        filters: dict[str, Any] | None = None,
+        populate: list[str] | dict[str, Any] | str | None = None,
+        fields: list[str] | None = None,
+        publication_state: str | None = None,
+        locale: str | None = None,
+        batch_size: int = 25,
+        max_concurrency: int = 1,
+        query_plan: QueryPlan | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Iterate over raw content of all pages without parsing documents, e.g. to validate them in other processes.
+
+        Only pagination metadata of the first page is parsed to get total count of documents. Pages after the first
+        one are requested with up to `max_concurrency` parallel requests and yielded in offset order.
+        """
+        self._check_pagination_arguments(batch_size, max_concurrency, "offset")
         params = ApiParameters(
             sort=sort,
             filters=filters,
             populate=populate,
             fields=fields,
-            page=page,
-            page_size=batch_size,
-            start=start,
             limit=batch_size,
             publication_state=publication_state,
             locale=locale,
-        )
+        ).with_query_plan(query_plan)
+
+        async def get_page(start: int) -> bytes:
+            page_params = params.model_copy(update={"start": start, "with_count": start == 0})
+            res = await self.send_get_request(plural_api_id, params=page_params.stringify())
+            return res.content
+
+        first_page = await get_page(0)
+        meta = DocumentsPageMeta.model_validate_json(first_page)
+        self._check_page_limit(meta, batch_size)
+        start_list = iter(range(batch_size, meta.meta.get_total_count(), batch_size))
+        pending: deque[asyncio.Future[bytes]] = deque()
+
+        def schedule() -> None:
+            while len(pending) < max_concurrency and (cur_start := next(start_list, None)) is not None:
+                pending.append(asyncio.ensure_future(get_page(cur_start)))
+
+        try:
+            schedule()
+            yield first_page
+            while pending:
+                page = await pending.popleft()
+                schedule()
+                yield page
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def _get_pages(
+        self,
+        page_type: type[PageType],
+        plural_api_id: str,
+        params: ApiParameters,
+        batch_size: int | Literal["auto"],
+        with_count: bool,
+        max_concurrency: int,
+        pagination_mode: PaginationMode,
+        keyset_field: str,
+        query_plan: QueryPlan | None,
+    ) -> AsyncIterator[PageType]:
+        """Get specific page if `page` or `start` is set in parameters, otherwise iterate over all pages."""
+        self._check_pagination_arguments(batch_size, max_concurrency, pagination_mode)
+        page_size = batch_size if isinstance(batch_size, int) else None
+        if page_size is None and (params.page is not None or params.start is not None):
+            raise ValueError("Adaptive batch size is available only when getting all documents")
+        params = params.model_copy(update={"page_size": page_size, "limit": page_size}).with_query_plan(query_plan)
         if params.page is not None or params.start is not None:  # Get specific page/batch
             res = await self.send_get_request(plural_api_id, params=params.stringify())
-            return DocumentsResponse.model_validate(res.json())
-        else:  # Get all records
-            params.start = 0
-            params.with_count = True
-            res = await self.send_get_request(plural_api_id, params=params.stringify())
-            res_page = DocumentsResponse.model_validate(res.json())
-            start_list = [i for i in range(batch_size, res_page.meta.get_total_count(), batch_size)]
-            all_data = res_page
+            yield await self._parse_documents_response(res, page_type)
+            return
+        if not isinstance(batch_size, int):
+            pages = self._iter_adaptive_pages(
+                page_type, plural_api_id, params, with_count, pagination_mode, keyset_field
+            )
+        elif pagination_mode == "keyset":
+            pages = self._iter_keyset_pages(page_type, plural_api_id, params, batch_size, keyset_field)
+        else:
+            pages = self._iter_offset_pages(
+                page_type,
+                plural_api_id,
+                params,
+                batch_size,
+                with_count,
+                max_concurrency,
+                pagination_mode == "count_free",
+            )
+        async for res_page in pages:
+            yield res_page
+
+    async def _iter_adaptive_pages(
+        self,
+        page_type: type[PageType],
+        plural_api_id: str,
+        params: ApiParameters,
+        with_count: bool,
+        pagination_mode: PaginationMode,
+        keyset_field: str,
+    ) -> AsyncIterator[PageType]:
+        batch_sizer = AdaptiveBatchSize()
+        start = 0
+        total: int | None = None
+        last_value: Any | None = None
+        while True:
+            limit = batch_sizer.batch_size
+            if pagination_mode == "keyset":
+                page_params = params.keyset_page(keyset_field, last_value).model_copy(update={"limit": limit})
+            else:
+                page_with_count = pagination_mode == "offset" and (start == 0 or with_count)
+                page_params = params.model_copy(update={"start": start, "limit": limit, "with_count": page_with_count})
+            started_at = time.perf_counter()
+            res = await self.send_get_request(plural_api_id, params=page_params.stringify())
+            res_page = await self._parse_documents_response(res, page_type)
+            batch_sizer.record(
+                len(res_page.data), len(res.content), time.perf_counter() - started_at, res_page.meta.pagination.limit
+            )
+            yield res_page
+            # Offsets follow received documents, so a page clamped by the server does not skip any of them
+            start += len(res_page.data)
+            if pagination_mode == "offset":
+                if total is None:
+                    total = res_page.meta.get_total_count()
+                if start >= total or not res_page.data:
+                    return
+            elif self._is_last_page(res_page, limit):
+                return
+            elif pagination_mode == "keyset":
+                last_value = self._get_keyset_value(res_page, keyset_field)
+
+    async def _iter_keyset_pages(
+        self, page_type: type[PageType], plural_api_id: str, params: ApiParameters, batch_size: int, keyset_field: str
+    ) -> AsyncIterator[PageType]:
+        last_value: Any | None = None
+        while True:
+            res_page = await self._get_documents_page(
+                page_type, plural_api_id, params.keyset_page(keyset_field, last_value), 0, False
+            )
+            yield res_page
+            if self._is_last_page(res_page, batch_size):
+                return
+            last_value = self._get_keyset_value(res_page, keyset_field)
+
+    async def _iter_offset_pages(
+        self,
+        page_type: type[PageType],
+        plural_api_id: str,
+        params: ApiParameters,
+        batch_size: int,
+        with_count: bool,
+        max_concurrency: int,
+        count_free: bool,
+    ) -> AsyncIterator[PageType]:
+        first_page = await self._get_documents_page(page_type, plural_api_id, params, 0, not count_free)
+        start_list: Iterator[int]
+        if count_free:
+            # Total count is never requested, so next offsets are requested until a short page is returned
+            self._check_page_limit(first_page, batch_size)
+            with_count = False
+            if self._is_last_page(first_page, batch_size):
+                start_list = iter(())
+            else:
+                start_list = itertools.count(batch_size, batch_size)
+        else:
+            start_list = iter(range(batch_size, first_page.meta.get_total_count(), batch_size))
+        if max_concurrency == 1:
+            yield first_page
             for cur_start in start_list:
-                params.start = cur_start
-                params.with_count = with_count
-                res = await self.send_get_request(plural_api_id, params=params.stringify())
-                res_page = DocumentsResponse.model_validate(res.json())
-                all_data.data += res_page.data
-                all_data.meta = res_page.meta
-            return all_data
+                res_page = await self._get_documents_page(page_type, plural_api_id, params, cur_start, with_count)
+                yield res_page
+                if count_free and self._is_last_page(res_page, batch_size):
+                    return
+            return
+        pending: deque[asyncio.Future[PageType]] = deque()
+
+        def schedule() -> None:
+            while len(pending) < max_concurrency and (cur_start := next(start_list, None)) is not None:
+                pending.append(
+                    asyncio.ensure_future(
+                        self._get_documents_page(page_type, plural_api_id, params, cur_start, with_count)
+                    )
+                )
+
+        try:
+            schedule()
+            yield first_page
+            while pending:
+                res_page = await pending.popleft()
+                if count_free and self._is_last_page(res_page, batch_size):
+                    yield res_page
+                    return
+                schedule()
+                yield res_page
+        finally:
+            # Do not leave pages running in background after a failure or early exit
+            for task in pending:
+                task.cancel()
+
+    async def _get_documents_page(
+        self, page_type: type[PageType], plural_api_id: str, params: ApiParameters, start: int, with_count: bool
+    ) -> PageType:
+        page_params = params.model_copy(update={"start": start, "with_count": with_count})
+        res = await self.send_get_request(plural_api_id, params=page_params.stringify())
+        return await self._parse_documents_response(res, page_type)
+
+    async def _parse_documents_response(self, res: httpx2.Response, page_type: type[PageType]) -> PageType:
+        config = self.cooperative_validation
+        if config and config.offload_to_thread and len(res.content) >= config.min_offload_bytes:
+            # Parsing of large page blocks event loop, so it is done in a worker thread
+            return await asyncio.to_thread(page_type.model_validate_json, res.content)
+        return page_type.model_validate_json(res.content)
 
     async def create_or_update_single_document(
         self, single_api_id: str, data: dict[str, Any] | BaseModel
     ) -> DocumentResponse:
         """Create or update single type document."""
         res = await self.send_put_request(single_api_id, body={"data": serialize_document_data(data)})
-        return DocumentResponse.model_validate(res.json())
+        await self._ainvalidate_cache(single_api_id)
+        return DocumentResponse.model_validate_json(res.content)
 
     async def create_document(self, plural_api_id: str, data: dict[str, Any] | BaseModel) -> DocumentResponse:
         """Create new document."""
@@ -132,7 +585,8 @@ class StrapiClientAsync(StrapiClientBase):
             plural_api_id,
             json={"data": serialize_document_data(data)},
         )
-        return DocumentResponse.model_validate(res.json())
+        await self._ainvalidate_cache(plural_api_id)
+        return DocumentResponse.model_validate_json(res.content)
 
     async def update_document(
         self, plural_api_id: str, document_id: str, data: dict[str, Any] | BaseModel
@@ -142,29 +596,164 @@ class StrapiClientAsync(StrapiClientBase):
             f"{plural_api_id}/{document_id}",
             body={"data": serialize_document_data(data)},
         )
-        return DocumentResponse.model_validate(res.json())
+        await self._ainvalidate_cache(plural_api_id)
+        return DocumentResponse.model_validate_json(res.content)
 
     async def delete_single_document(self, single_api_id: str) -> None:
         """Delete single type document."""
         await self.send_delete_request(single_api_id)
+        await self._ainvalidate_cache(single_api_id)
 
     async def delete_document(self, plural_api_id: str, document_id: str) -> None:
         """Delete document by document id."""
         await self.send_delete_request(f"{plural_api_id}/{document_id}")
+        await self._ainvalidate_cache(plural_api_id)
+
+    async def create_documents(
+        self, plural_api_id: str, data: list[dict[str, Any] | BaseModel], max_concurrency: int = 4
+    ) -> BulkResult:
+        """Create several documents with up to `max_concurrency` parallel requests.
+
+        Failed documents do not stop other ones and are reported in the result in input order.
+        """
+        return await self._run_bulk(
+            [(None, partial(self.create_document, plural_api_id, item)) for item in data], max_concurrency
+        )
+
+    async def update_documents(
+        self, plural_api_id: str, data: dict[str, dict[str, Any] | BaseModel], max_concurrency: int = 4
+    ) -> BulkResult:
+        """Update several documents by document ids with up to `max_concurrency` parallel requests.
+
+        Failed documents do not stop other ones and are reported in the result in input order.
+        """
+        return await self._run_bulk(
+            [
+                (document_id, partial(self.update_document, plural_api_id, document_id, item))
+                for document_id, item in data.items()
+            ],
+            max_concurrency,
+        )
+
+    async def delete_documents(
+        self, plural_api_id: str, document_ids: list[str], max_concurrency: int = 4
+    ) -> BulkResult:
+        """Delete several documents by document ids with up to `max_concurrency` parallel requests.
+
+        Failed documents do not stop other ones and are reported in the result in input order.
+        """
+        return await self._run_bulk(
+            [(document_id, partial(self.delete_document, plural_api_id, document_id)) for document_id in document_ids],
+            max_concurrency,
+        )
+
+    async def _run_bulk(self, operations: list[tuple[str | None, BulkOperation]], max_concurrency: int) -> BulkResult:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than or equal to 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(index: int, document_id: str | None, operation: BulkOperation) -> BulkItemResult:
+            async with semaphore:
+                try:
+                    response = await operation()
+                except (RuntimeError, ValueError, httpx2.HTTPError) as e:
+                    return BulkItemResult(index=index, document_id=document_id, error=str(e))
+            return self._get_bulk_item_result(index, document_id, response)
+
+        items = await asyncio.gather(*(run(i, document_id, op) for i, (document_id, op) in enumerate(operations)))
+        return BulkResult(items=list(items))
 
     async def send_get_request(
         self,
         route: str,
         params: dict[str, Any] | str | None = None,
         use_auth: bool = True,
+        use_cache: bool = True,
+    ) -> httpx2.Response:
+        """Send GET request to custom endpoint.
+
+        Response is served from cache of the client when available. Identical requests sent concurrently
+        share a single request to the server and its response.
+        """
+        key = self._get_cache_key(route, params, use_auth)
+        entry = await self._run_cache_call(self.cache.get, key) if self.cache is not None and use_cache else None
+        if entry is not None and self.cache is not None and self.cache.is_usable(entry):
+            if not self.cache.is_fresh(entry):
+                self._revalidate_in_background(key, route, params, use_auth, entry)
+            return entry.to_response(urljoin(self.api_url, route))
+        future = self._in_flight.get(key)
+        if future is None:
+            if self.cache is None or not use_cache:
+                request = self._send_request("GET", route, use_auth=use_auth, params=params)
+            else:
+                request = self._send_cached_get_request(key, route, params, use_auth, entry)
+            future = asyncio.ensure_future(request)
+            self._in_flight[key] = future
+            future.add_done_callback(lambda f: self._finish_in_flight(key, f))
+        # Cancellation of one of the callers must not cancel the request shared with others
+        return await asyncio.shield(future)
+
+    def _finish_in_flight(self, key: str, future: asyncio.Future[httpx2.Response]) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            future.exception()  # Mark exception as retrieved when all callers were cancelled
+
+    async def _send_cached_get_request(
+        self,
+        key: str,
+        route: str,
+        params: dict[str, Any] | str | None,
+        use_auth: bool,
+        entry: CachedResponse | None = None,
     ) -> httpx2.Response:
-        """Send GET request to custom endpoint."""
-        res = await self.client.get(
-            url=urljoin(self.api_url, route), params=params, headers=self._auth_header if use_auth else None
+        """Send GET request and store response in cache, revalidating the cached entry when possible.
+
+        On `304 Not Modified` the cached bytes are returned as a new response, so the body is not transferred
+        but is parsed again by the caller. Parsed models are not cached because they are mutable and would be
+        shared between callers.
+        """
+        headers = entry.validation_headers if entry else {}
+        invalidation_count = self._invalidation_count
+        res = await self._send_request(
+            "GET", route, use_auth=use_auth, params=params, headers=headers, accept_not_modified=bool(headers)
         )
-        self._check_response(res, "Unable to send GET request")
+        if res.status_code == 304 and entry is not None:
+            # Content is not modified since it was cached, so cached response is refreshed and served
+            entry = entry.model_copy(update={"stored_at": time.time()})
+            await self._run_cache_call(self._set_cache_entry, key, entry, invalidation_count)
+            return entry.to_response(urljoin(self.api_url, route))
+        await self._run_cache_call(self._set_cache_entry, key, CachedResponse.from_response(res), invalidation_count)
         return res
 
+    async def _run_cache_call(self, func: Callable[..., T], *args: Any) -> T:
+        """Call cache backend, in a worker thread if it blocks on I/O, e.g. SQLite cache."""
+        if self.cache is not None and self.cache.blocking:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    async def _ainvalidate_cache(self, route: str) -> None:
+        self._drop_in_flight(route)
+        await self._run_cache_call(self._invalidate_cached_responses, route)
+
+    def _revalidate_in_background(
+        self, key: str, route: str, params: dict[str, Any] | str | None, use_auth: bool, entry: CachedResponse
+    ) -> None:
+        if self._start_revalidation(key):
+            task = asyncio.ensure_future(self._revalidate(key, route, params, use_auth, entry))
+            self._revalidation_tasks.add(task)
+            task.add_done_callback(self._revalidation_tasks.discard)
+
+    async def _revalidate(
+        self, key: str, route: str, params: dict[str, Any] | str | None, use_auth: bool, entry: CachedResponse
+    ) -> None:
+        try:
+            await self._send_cached_get_request(key, route, params, use_auth, entry)
+        except (RuntimeError, httpx2.HTTPError):
+            pass  # Stale entry is served until it expires
+        finally:
+            self._finish_revalidation(key)
+
     async def send_put_request(
         self,
         route: str,
@@ -173,11 +762,7 @@ class StrapiClientAsync(StrapiClientBase):
         use_auth: bool = True,
     ) -> httpx2.Response:
         """Send PUT request to custom endpoint."""
-        res = await self.client.put(
-            url=urljoin(self.api_url, route), json=body, params=params, headers=self._auth_header if use_auth else None
-        )
-        self._check_response(res, "Unable to send PUT request")
-        return res
+        return await self._send_request("PUT", route, use_auth=use_auth, json=body, params=params)
 
     async def send_post_request(
         self,
@@ -189,24 +774,64 @@ class StrapiClientAsync(StrapiClientBase):
         use_auth: bool = True,
     ) -> httpx2.Response:
         """Send POST request to custom endpoint."""
-        res = await self.client.post(
-            url=urljoin(self.api_url, route),
-            json=json,
-            params=params,
-            data=data,
-            files=files,
-            headers=self._auth_header if use_auth else None,
+        return await self._send_request(
+            "POST", route, use_auth=use_auth, json=json, params=params, data=data, files=files
         )
-        self._check_response(res, "Unable to send POST request")
-        return res
 
     async def send_delete_request(self, route: str, use_auth: bool = True) -> httpx2.Response:
         """Send DELETE request to custom endpoint."""
-        res = await self.client.delete(
-            url=urljoin(self.api_url, route), headers=self._auth_header if use_auth else None
-        )
-        self._check_response(res, "Unable to send DELETE request")
-        return res
+        return await self._send_request("DELETE", route, use_auth=use_auth)
+
+    async def _send_request(
+        self,
+        method: str,
+        route: str,
+        use_auth: bool = True,
+        headers: dict[str, str] | None = None,
+        accept_not_modified: bool = False,
+        **kwargs: Any,
+    ) -> httpx2.Response:
+        """Send request and retry it according to retry policy of the client."""
+        url = urljoin(self.api_url, route)
+        headers = {**(self._auth_header if use_auth else {}), **(headers or {})}
+        if kwargs.get("json") is not None:
+            # Body is encoded once with codec of the client and reused by retries
+            kwargs["content"] = self.json_codec.dumps(kwargs.pop("json"))
+            headers["Content-Type"] = "application/json"
+        attempt = 0
+        while True:
+            try:
+                async with self._limit_request(route):
+                    res = await self._request_with_concurrency_control(method, url, headers=headers, **kwargs)
+            except httpx2.TransportError:
+                delay = self._get_retry_delay(method, attempt, None)
+                if delay is None:
+                    raise
+            else:
+                delay = self._get_retry_delay(method, attempt, res)
+                if delay is None:
+                    if not (accept_not_modified and res.status_code == 304):
+                        self._check_response(res, f"Unable to send {method} request")
+                    return res
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _request_with_concurrency_control(self, method: str, url: str, **kwargs: Any) -> httpx2.Response:
+        if self.concurrency_controller is None:
+            return await self.client.request(method, url, **kwargs)
+        async with self.concurrency_controller.slot() as started_at:
+            try:
+                res = await self.client.request(method, url, **kwargs)
+            except httpx2.TransportError:
+                await self.concurrency_controller.record(started_at, failed=True)
+                raise
+            await self.concurrency_controller.record(
+                started_at, failed=res.status_code == 429 or res.status_code >= 500
+            )
+            return res
+
+    def _limit_request(self, route: str) -> AbstractAsyncContextManager[None]:
+        return self.rate_limiter.limit_async(route) if self.rate_limiter else nullcontext()
 
     async def upload_files(
         self,
@@ -222,7 +847,7 @@ class StrapiClientAsync(StrapiClientBase):
             data = {"ref": content_type_id, "refId": document_id, "field": field}
         res = await self.send_post_request("upload", data=data, files=[fp.to_files_tuple() for fp in file_payloads])
         self._check_response(res, "Unable to send POST request")
-        return [MediaImageDocument.model_validate(d) for d in (res.json() or [])]
+        return MediaImageDocument.from_list_json(res.content or b"[]")
 
     async def upload_file(
         self,
@@ -252,7 +877,7 @@ class StrapiClientAsync(StrapiClientBase):
         """Get uploaded files."""
         params = ApiParameters(filters=filters)
         res = await self.send_get_request("upload/files", params=params.stringify())
-        return res.json()
+        return self.json_codec.loads(res.content)
 
     async def check_health(self) -> bool:
         """Check if Strapi API is available."""
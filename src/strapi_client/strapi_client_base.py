@@ -1,5 +1,23 @@
+import hashlib
+import threading
+from typing import Any, Literal
+
 import httpx2
-from pydantic import SecretStr
+from pydantic import BaseModel, SecretStr
+
+from strapi_client.json_codec import JsonCodec, StdlibJsonCodec
+from strapi_client.models.bulk_result import BulkItemResult
+from strapi_client.models.rate_limit import RateLimit
+from strapi_client.models.response import (
+    DocumentResponse,
+    DocumentsPageMeta,
+    DocumentsResponse,
+    TypedDocumentsResponse,
+)
+from strapi_client.models.retry_policy import RetryPolicy
+from strapi_client.rate_limiter import RateLimiter
+from strapi_client.response_cache import CachedResponse, ResponseCache
+from strapi_client.types import PaginationMode
 
 
 class StrapiClientBase:
@@ -7,25 +25,182 @@ class StrapiClientBase:
 
     base_url: str
     timeout: httpx2.Timeout | None = None
+    limits: httpx2.Limits | None = None
+    http2: bool = False
+    transport: httpx2.BaseTransport | httpx2.AsyncBaseTransport | None = None
+    retry_policy: RetryPolicy | None = None
+    rate_limiter: RateLimiter | None = None
+    cache: ResponseCache | None = None
+    json_codec: JsonCodec
     _token: SecretStr | None = None
 
-    def __init__(self, base_url: str, token: str | None = None, timeout: httpx2.Timeout | None = None) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        token: str | None = None,
+        timeout: httpx2.Timeout | None = None,
+        limits: httpx2.Limits | None = None,
+        http2: bool = False,
+        transport: httpx2.BaseTransport | httpx2.AsyncBaseTransport | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limit: RateLimit | None = None,
+        route_rate_limits: dict[str, RateLimit] | None = None,
+        cache: ResponseCache | None = None,
+        json_codec: JsonCodec | None = None,
+    ) -> None:
+        """Initialize client.
+
+        Args:
+            base_url: URL of Strapi instance.
+            token: API token.
+            timeout: Request timeout configuration.
+            limits: Connection pool size and keep-alive expiry, e.g. to allow concurrent batch requests.
+            http2: Enable HTTP/2 multiplexing, requires `httpx2[http2]` to be installed.
+            transport: Custom transport to send requests with.
+            retry_policy: Policy of retrying failed requests, requests are not retried by default.
+            rate_limit: Limit of request rate and requests in flight for all requests of the client.
+            route_rate_limits: Additional limits for requests by route prefix, e.g. `{"upload": RateLimit(...)}`.
+            cache: Cache of GET responses, invalidated by writes of the client to the same collection.
+            json_codec: Codec of JSON request bodies and responses, standard library json is used by default.
+        """
         self.base_url = base_url.rstrip("/") + "/"
         if token:
             self._token = SecretStr(token)
         self.timeout = timeout
+        self.limits = limits
+        self.http2 = http2
+        self.transport = transport
+        self.retry_policy = retry_policy
+        if rate_limit or route_rate_limits:
+            self.rate_limiter = RateLimiter(rate_limit, route_rate_limits)
+        self.cache = cache
+        self.json_codec = json_codec or StdlibJsonCodec()
+        self._revalidating: set[str] = set()
+        self._revalidating_lock = threading.Lock()
+        self._in_flight: dict[str, Any] = {}  # Identical GET requests in flight, shared by their callers
+        self._in_flight_lock = threading.Lock()
+        self._invalidation_count = 0
+        self._route_invalidations: dict[str, int] = {}  # Route to number of its last invalidation
+        self._invalidation_lock = threading.Lock()
 
     @property
     def api_url(self) -> str:
         return self.base_url + "api/"
 
+    @property
+    def _client_options(self) -> dict[str, Any]:
+        options: dict[str, Any] = {"timeout": self.timeout, "http2": self.http2}
+        if self.limits is not None:
+            options["limits"] = self.limits
+        return options
+
     @property
     def _auth_header(self) -> dict[str, str]:
         if self._token is None:
             raise ValueError("Authorization token is not set, use authorize() method first")
         return {"Authorization": "Bearer " + self._token.get_secret_value()}
 
+    def _get_cache_key(self, route: str, params: dict[str, Any] | str | None, use_auth: bool) -> str:
+        """Get cache key of GET request, separating responses of different tokens."""
+        query = params if isinstance(params, str) else str(httpx2.QueryParams(params or {}))
+        key = f"{route.strip('/')}?{query}"
+        if not use_auth:
+            return key + "#public"
+        # Short hash identifies the token without storing the secret in cache
+        fingerprint = hashlib.sha256(self._auth_header["Authorization"].encode()).hexdigest()[:16]
+        return f"{key}#{fingerprint}"
+
+    def _invalidate_cache(self, route: str) -> None:
+        self._drop_in_flight(route)
+        self._invalidate_cached_responses(route)
+
+    def _drop_in_flight(self, route: str) -> None:
+        with self._in_flight_lock:
+            # GET requests sent before the write may return old data, so later requests must not join them
+            for key in [key for key in self._in_flight if ResponseCache.matches_route(key, route)]:
+                del self._in_flight[key]
+
+    def _invalidate_cached_responses(self, route: str) -> None:
+        with self._invalidation_lock:
+            self._invalidation_count += 1
+            self._route_invalidations[route.strip("/")] = self._invalidation_count
+            if self.cache is not None:
+                self.cache.invalidate(route)
+
+    def _set_cache_entry(self, key: str, entry: CachedResponse, invalidation_count: int) -> None:
+        """Store response in cache unless its route was invalidated after the request was sent.
+
+        Args:
+            key: Cache key of the request.
+            entry: Response to store.
+            invalidation_count: Value of `_invalidation_count` read before the request was sent.
+        """
+        if self.cache is None:
+            return
+        with self._invalidation_lock:
+            for route, count in self._route_invalidations.items():
+                if count > invalidation_count and ResponseCache.matches_route(key, route):
+                    return  # Response may be older than the write, so it must not outlive it in cache
+            self.cache.set(key, entry)
+
+    def _start_revalidation(self, key: str) -> bool:
+        with self._revalidating_lock:
+            if key in self._revalidating:
+                return False
+            self._revalidating.add(key)
+            return True
+
+    def _finish_revalidation(self, key: str) -> None:
+        with self._revalidating_lock:
+            self._revalidating.discard(key)
+
+    def _get_retry_delay(self, method: str, attempt: int, res: httpx2.Response | None) -> float | None:
+        if self.retry_policy is None:
+            return None
+        return self.retry_policy.get_delay(method, attempt, res)
+
     @staticmethod
     def _check_response(res: httpx2.Response, message: str) -> None:
         if not (200 <= res.status_code < 300):
             raise RuntimeError(f"{message} error {res.status_code}: {res.reason_phrase}")
+
+    @staticmethod
+    def _check_pagination_arguments(
+        batch_size: int | Literal["auto"], max_concurrency: int, pagination_mode: PaginationMode
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than or equal to 1")
+        if batch_size == "auto" and max_concurrency > 1:
+            raise ValueError("Adaptive batch size requests pages sequentially and does not support max_concurrency")
+        if pagination_mode == "keyset" and max_concurrency > 1:
+            raise ValueError("Keyset pagination requests pages sequentially and does not support max_concurrency")
+
+    @staticmethod
+    def _get_bulk_item_result(index: int, document_id: str | None, response: DocumentResponse | None) -> BulkItemResult:
+        if document_id is None and response is not None:
+            document_id = response.data.get("documentId")
+        return BulkItemResult(index=index, document_id=document_id, response=response)
+
+    @staticmethod
+    def _get_keyset_value(res_page: DocumentsResponse | TypedDocumentsResponse[Any], keyset_field: str) -> Any:
+        last_document = res_page.data[-1]
+        if isinstance(last_document, BaseModel):
+            last_document = last_document.model_dump(mode="json", by_alias=True)
+        last_value = last_document.get(keyset_field)
+        if last_value is None:
+            raise ValueError(f"Keyset field '{keyset_field}' is missing in response")
+        return last_value
+
+    @staticmethod
+    def _is_last_page(res_page: DocumentsResponse | TypedDocumentsResponse[Any], batch_size: int) -> bool:
+        # Server may clamp requested limit to its maxLimit, so a clamped page is not a short one
+        page_limit = res_page.meta.pagination.limit or batch_size
+        return len(res_page.data) < min(page_limit, batch_size)
+
+    @staticmethod
+    def _check_page_limit(
+        res_page: DocumentsResponse | TypedDocumentsResponse[Any] | DocumentsPageMeta, batch_size: int
+    ) -> None:
+        page_limit = res_page.meta.pagination.limit
+        if page_limit is not None and page_limit < batch_size:
+            raise RuntimeError(f"Page size is limited by server to {page_limit}, batch_size should not exceed it")
@@ -12,3 +12,14 @@ WebhookEventName = Literal[
     "releases.publish",
     "trigger-test",
 ]
+
+PaginationMode = Literal[
+    "offset",
+    "keyset",
+    "count_free",
+]
+
+ExportFormat = Literal[
+    "models",
+    "ndjson",
+]
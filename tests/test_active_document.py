@@ -0,0 +1,59 @@
+import asyncio
+import json
+from urllib.parse import parse_qs
+
+import httpx2
+import pytest
+from pydantic import Field
+from strapi_client import ActiveDocument, DocumentField, StrapiClientAsync
+
+
+class User(ActiveDocument):
+    username: str = DocumentField(unique=True)
+    first_name: str = Field(alias='firstName')
+
+
+class Session(ActiveDocument):
+    uid: str = DocumentField(alias='sessionUid', unique=True)
+    user: User | None = DocumentField(default=None, relation=True)
+
+
+def test_field_metadata_is_computed_once_per_class():
+    assert User.__unique_fields__ == ('id', 'document_id', 'username')
+    assert User.__relation_fields__ == ()
+    assert Session.__relation_fields__ == ('user',)
+    assert Session.__scalar_fields__ == Session.__document_fields__[:-1]
+    assert Session.__document_fields__[-2:] == ('sessionUid', 'user')
+    assert Session.__field_aliases__['uid'] == 'sessionUid'
+    assert Session._get_document_fields(with_relations=False) is Session.__scalar_fields__
+    with pytest.raises(TypeError):
+        Session.__field_aliases__['uid'] = 'uid'  # type: ignore[index]
+
+
+def test_field_metadata_of_base_class():
+    assert ActiveDocument._get_relation_fields() == ()
+    assert ActiveDocument._get_document_fields() == ('id', 'documentId', 'createdAt', 'updatedAt', 'publishedAt')
+    document = ActiveDocument()
+    assert document._unique_fields == ('id', 'document_id')
+    assert document.relations_populated()
+
+
+def test_upsert_filters_by_field_alias():
+    requests: list[httpx2.Request] = []
+
+    def handler(request: httpx2.Request) -> httpx2.Response:
+        requests.append(request)
+        if request.method == 'GET':
+            return httpx2.Response(200, json={'data': [], 'meta': {'pagination': {'total': 0}}})
+        data = json.loads(request.content)['data']
+        return httpx2.Response(200, json={'data': {'id': 1, 'documentId': 'doc1', **data}, 'meta': {}})
+
+    async def run():
+        client = StrapiClientAsync(base_url='http://test/api', token='token')
+        client._client = httpx2.AsyncClient(transport=httpx2.MockTransport(handler))
+        return await Session(sessionUid='123').upsert_document(client)
+
+    session = asyncio.run(run())
+    assert session.document_id == 'doc1'
+    query = parse_qs(requests[0].url.query.decode())
+    assert query['filters[sessionUid][$eq]'] == ['123']
@@ -0,0 +1,34 @@
+import pytest
+from strapi_client.adaptive_batch_size import AdaptiveBatchSize
+
+
+def test_grows_while_time_per_document_decreases():
+    sizer = AdaptiveBatchSize(initial_size=10, max_size=100)
+    sizer.record(documents_count=10, content_length=1000, elapsed=1.0, server_limit=10)
+    assert sizer.batch_size == 20
+    sizer.record(documents_count=20, content_length=2000, elapsed=1.0, server_limit=20)
+    assert sizer.batch_size == 40
+
+
+def test_shrinks_when_time_per_document_increases():
+    sizer = AdaptiveBatchSize(initial_size=20, min_size=10)
+    sizer.record(documents_count=20, content_length=1000, elapsed=1.0, server_limit=20)
+    sizer.record(documents_count=40, content_length=2000, elapsed=4.0, server_limit=40)
+    assert sizer.batch_size == 20
+
+
+def test_respects_server_limit_and_page_bytes():
+    sizer = AdaptiveBatchSize(initial_size=50, min_size=10, max_page_bytes=10_000)
+    sizer.record(documents_count=30, content_length=3000, elapsed=1.0, server_limit=30)
+    assert sizer.max_size == 30
+    assert sizer.batch_size == 30
+    sizer = AdaptiveBatchSize(initial_size=50, min_size=10, max_page_bytes=10_000)
+    sizer.record(documents_count=50, content_length=5000, elapsed=1.0, server_limit=50)
+    assert sizer.batch_size == 100
+    sizer.record(documents_count=100, content_length=100_000, elapsed=1.0, server_limit=100)
+    assert sizer.batch_size == 10
+
+
+def test_rejects_invalid_sizes():
+    with pytest.raises(ValueError):
+        AdaptiveBatchSize(initial_size=5, min_size=10)
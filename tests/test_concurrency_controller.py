@@ -0,0 +1,78 @@
+import asyncio
+import time
+
+import httpx2
+import pytest
+from pydantic import ValidationError
+from strapi_client import AdaptiveConcurrency, StrapiClientAsync
+from strapi_client.concurrency_controller import ConcurrencyController
+
+
+def test_limit_grows_additively_while_latency_is_low():
+    async def run():
+        controller = ConcurrencyController(AdaptiveConcurrency(initial_limit=2, window_size=3, target_latency=1))
+        for _ in range(6):
+            await controller.record(time.monotonic(), failed=False)
+        return controller.limit
+
+    assert asyncio.run(run()) == 4
+
+
+def test_limit_is_cut_once_per_failure_burst():
+    async def run():
+        controller = ConcurrencyController(AdaptiveConcurrency(initial_limit=16))
+        started_at = time.monotonic()
+        await controller.record(started_at, failed=True)
+        await controller.record(started_at, failed=True)
+        first_cut = controller.limit
+        await controller.record(time.monotonic(), failed=True)
+        return first_cut, controller.limit
+
+    assert asyncio.run(run()) == (8, 4)
+
+
+def test_limit_is_cut_on_latency_spike():
+    async def run():
+        controller = ConcurrencyController(AdaptiveConcurrency(initial_limit=8, window_size=2, target_latency=0.01))
+        for _ in range(2):
+            await controller.record(time.monotonic() - 1, failed=False)
+        return controller.limit
+
+    assert asyncio.run(run()) == 4
+
+
+def test_invalid_limits():
+    with pytest.raises(ValidationError):
+        AdaptiveConcurrency(initial_limit=10, max_limit=5)
+
+
+def test_async_client_limits_requests_in_flight():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.005)
+        in_flight -= 1
+        if request.url.path.endswith('/0'):
+            return httpx2.Response(503)
+        return httpx2.Response(200, json={'data': {'id': 1}})
+
+    async def run():
+        async with StrapiClientAsync(
+            base_url='http://test',
+            token='token',
+            transport=httpx2.MockTransport(handler),
+            adaptive_concurrency=AdaptiveConcurrency(initial_limit=4, max_limit=4),
+        ) as c:
+            results = await asyncio.gather(
+                *(c.get_document('items', str(i)) for i in range(20)), return_exceptions=True
+            )
+            return results, c.concurrency_controller.limit
+
+    results, limit = asyncio.run(run())
+    assert isinstance(results[0], RuntimeError)
+    assert max_in_flight == 4
+    assert limit == 2
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import time
+
+import httpx2
+from strapi_client import BaseDocument, CooperativeValidation, DocumentsResponse, StrapiClientAsync
+from strapi_client.models.cooperative_validation import run_in_time_slices
+
+NOW = '2024-01-01T00:00:00Z'
+
+
+class Item(BaseDocument):
+    name: str
+
+
+def rows(count: int) -> list[dict]:
+    return [
+        {'id': i, 'documentId': str(i), 'createdAt': NOW, 'updatedAt': NOW, 'publishedAt': NOW, 'name': f'Item {i}'}
+        for i in range(count)
+    ]
+
+
+def slow_process(chunk: list[int]) -> list[int]:
+    time.sleep(0.0005 * len(chunk))
+    return [item * 2 for item in chunk]
+
+
+async def count_ticks(processing: asyncio.Future) -> int:
+    ticks = 0
+    while not processing.done():
+        ticks += 1
+        await asyncio.sleep(0)
+    return ticks
+
+
+def test_processing_yields_to_event_loop_between_chunks():
+    async def run():
+        processing = asyncio.ensure_future(
+            run_in_time_slices(list(range(200)), slow_process, CooperativeValidation(max_time_slice=0.005))
+        )
+        ticks, results = await asyncio.gather(count_ticks(processing), processing)
+        return ticks, results
+
+    ticks, results = asyncio.run(run())
+    assert results == [item * 2 for item in range(200)]
+    assert ticks > 5
+
+
+def test_processing_can_be_offloaded_to_thread():
+    threads = set()
+
+    def process(chunk):
+        threads.add(threading.get_ident())
+        return chunk
+
+    config = CooperativeValidation(offload_to_thread=True)
+    assert asyncio.run(run_in_time_slices(list(range(100)), process, config)) == list(range(100))
+    assert threading.get_ident() not in threads
+
+
+def test_afrom_list_response_matches_from_list_response():
+    response = DocumentsResponse.model_validate({'data': rows(500), 'meta': {'pagination': {}}})
+    documents = asyncio.run(Item.afrom_list_response(response, config=CooperativeValidation(max_time_slice=0.001)))
+    assert documents == Item.from_list_response(response)
+
+
+def test_async_client_parses_large_pages_in_thread():
+    threads = set()
+
+    def handler(request):
+        return httpx2.Response(200, json={'data': rows(30), 'meta': {'pagination': {'start': 0, 'limit': 50, 'total': 30}}})
+
+    async def run():
+        config = CooperativeValidation(offload_to_thread=True, min_offload_bytes=0)
+        async with StrapiClientAsync(
+            base_url='http://test', token='token', transport=httpx2.MockTransport(handler), cooperative_validation=config
+        ) as c:
+            original = DocumentsResponse.model_validate_json
+
+            def validate_json(content):
+                threads.add(threading.get_ident())
+                return original(content)
+
+            DocumentsResponse.model_validate_json = validate_json
+            try:
+                return await c.get_documents('items', batch_size=50)
+            finally:
+                DocumentsResponse.model_validate_json = original
+
+    assert len(asyncio.run(run()).data) == 30
+    assert threads and threading.get_ident() not in threads
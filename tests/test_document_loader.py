@@ -0,0 +1,82 @@
+import asyncio
+
+import httpx2
+import pytest
+from strapi_client import DocumentLoader, StrapiClientAsync
+
+
+def loader_transport(requests: list):
+    def handler(request):
+        requests.append(request)
+        document_ids = [v for k, v in request.url.params.multi_items() if k.startswith('filters[documentId][$in]')]
+        if 'broken' in document_ids:
+            return httpx2.Response(500)
+        data = [{'id': i, 'documentId': d} for i, d in enumerate(document_ids) if d != 'missing']
+        limit = int(request.url.params['pagination[limit]'])
+        return httpx2.Response(200, json={'data': data, 'meta': {'pagination': {'start': 0, 'limit': limit}}})
+
+    return httpx2.MockTransport(handler)
+
+
+def test_loader_batches_loads_made_in_one_iteration():
+    requests = []
+
+    async def run():
+        async with StrapiClientAsync(
+            base_url='http://test', token='token', transport=loader_transport(requests)
+        ) as c:
+            first, second, missing, duplicate = await asyncio.gather(
+                c.loader.load('items', 'a'),
+                c.loader.load('items', 'b'),
+                c.loader.load('items', 'missing'),
+                c.loader.load('items', 'a'),
+            )
+            other = await c.loader.load_many('users', ['x', 'y'], fields=['name'])
+            return first, second, missing, duplicate, other
+
+    first, second, missing, duplicate, other = asyncio.run(run())
+    assert first['documentId'] == 'a' and second['documentId'] == 'b' and missing is None
+    assert duplicate == first
+    assert [doc['documentId'] for doc in other] == ['x', 'y']
+    assert [request.url.path for request in requests] == ['/api/items', '/api/users']
+    assert requests[1].url.params['fields[0]'] == 'name'
+
+
+def test_loader_splits_batches_by_size_and_url_length():
+    requests = []
+
+    async def run():
+        async with StrapiClientAsync(
+            base_url='http://test', token='token', transport=loader_transport(requests)
+        ) as c:
+            c.loader = DocumentLoader(c, max_batch_size=10)
+            by_size = await c.loader.load_many('items', [f'doc{i}' for i in range(25)])
+            c.loader = DocumentLoader(c, max_url_length=500)
+            by_length = await c.loader.load_many('items', [f'document-{i:04}' for i in range(25)])
+            return by_size, by_length
+
+    by_size, by_length = asyncio.run(run())
+    assert [doc['documentId'] for doc in by_size] == [f'doc{i}' for i in range(25)]
+    assert [doc['documentId'] for doc in by_length] == [f'document-{i:04}' for i in range(25)]
+    assert len(requests) > 6
+    assert all(len(str(request.url)) <= 500 for request in requests[3:])
+
+
+def test_loader_propagates_errors_to_callers_of_the_batch():
+    requests = []
+
+    async def run():
+        async with StrapiClientAsync(
+            base_url='http://test', token='token', transport=loader_transport(requests)
+        ) as c:
+            return await asyncio.gather(
+                c.loader.load('items', 'a'), c.loader.load('items', 'broken'), return_exceptions=True
+            )
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_loader_rejects_invalid_batch_size():
+    with pytest.raises(ValueError):
+        DocumentLoader(StrapiClientAsync(base_url='http://test'), max_batch_size=0)
@@ -0,0 +1,59 @@
+import json
+
+import httpx2
+import pytest
+from strapi_client import StrapiClient
+from strapi_client.json_codec import OrjsonCodec, StdlibJsonCodec
+
+
+class RecordingCodec(StdlibJsonCodec):
+    def __init__(self):
+        self.encoded = []
+        self.decoded = 0
+
+    def dumps(self, data):
+        self.encoded.append(data)
+        return super().dumps(data)
+
+    def loads(self, content):
+        self.decoded += 1
+        return super().loads(content)
+
+
+def echo_handler(request):
+    if request.method == 'GET':
+        return httpx2.Response(200, json=[{'id': 1}])
+    assert request.headers['Content-Type'] == 'application/json'
+    return httpx2.Response(200, json={'data': json.loads(request.content)['data']})
+
+
+def test_stdlib_codec_round_trip():
+    codec = StdlibJsonCodec()
+    content = codec.dumps({'title': 'Привет', 'items': [1, 2.5, None]})
+    assert content == '{"title":"Привет","items":[1,2.5,null]}'.encode()
+    assert codec.loads(content) == {'title': 'Привет', 'items': [1, 2.5, None]}
+
+
+def test_client_encodes_request_bodies_and_decodes_responses_with_codec():
+    codec = RecordingCodec()
+    with StrapiClient(
+        base_url='http://test', token='token', transport=httpx2.MockTransport(echo_handler), json_codec=codec
+    ) as c:
+        assert c.create_document('items', {'title': 'a'}).data == {'title': 'a'}
+        assert c.update_document('items', '1', {'title': 'b'}).data == {'title': 'b'}
+        assert c.get_uploaded_files() == [{'id': 1}]
+    assert codec.encoded == [{'data': {'title': 'a'}}, {'data': {'title': 'b'}}]
+    assert codec.decoded == 1
+
+
+def test_default_codec_is_stdlib():
+    with StrapiClient(base_url='http://test', token='token') as c:
+        assert isinstance(c.json_codec, StdlibJsonCodec)
+    with pytest.raises(ValueError):
+        StdlibJsonCodec().dumps({'value': float('nan')})
+
+
+def test_orjson_codec_round_trip():
+    pytest.importorskip('orjson')
+    codec = OrjsonCodec()
+    assert codec.loads(codec.dumps({'title': 'a', 1: [True]})) == {'title': 'a', '1': [True]}
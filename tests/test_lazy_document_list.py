@@ -0,0 +1,46 @@
+from unittest.mock import patch
+
+import pytest
+from strapi_client import BaseDocument, DocumentsResponse, LazyDocumentList
+
+NOW = '2024-01-01T00:00:00Z'
+
+
+class Item(BaseDocument):
+    name: str
+
+
+def make_response(count: int) -> DocumentsResponse:
+    rows = [
+        {'id': i, 'documentId': str(i), 'createdAt': NOW, 'updatedAt': NOW, 'publishedAt': NOW, 'name': f'Item {i}'}
+        for i in range(count)
+    ]
+    return DocumentsResponse.model_validate({'data': rows, 'meta': {'pagination': {}}})
+
+
+def test_documents_are_validated_on_first_access():
+    documents = Item.lazy_from_list_response(make_response(100))
+    assert isinstance(documents, LazyDocumentList) and len(documents) == 100
+    assert documents.validated_count == 0
+    assert documents[5].name == 'Item 5' and documents[-1].id == 99
+    assert documents[5] is documents[5]
+    assert documents.validated_count == 2
+
+
+def test_slices_share_validated_documents():
+    documents = Item.lazy_from_list_response(make_response(10))
+    page = documents[2:8:2]
+    assert len(page) == 3 and [d.id for d in page] == [2, 4, 6]
+    assert page[0] is documents[2]
+    assert documents.validated_count == 3 and page.validated_count == 3
+    assert [d.id for d in documents[::-1][:2]] == [9, 8]
+    with pytest.raises(IndexError):
+        page[3]
+
+
+def test_iteration_stops_validating_when_caller_stops():
+    documents = Item.lazy_from_list_response(make_response(1000))
+    with patch.object(Item, 'model_validate', wraps=Item.model_validate) as validate:
+        first = next(d for d in documents if d.id >= 3)
+    assert first.id == 3 and validate.call_count == 4
+    assert len(documents.to_list()) == 1000 and documents.validated_count == 1000
@@ -0,0 +1,88 @@
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+import httpx2
+from strapi_client import SmartDocument, StrapiClientAsync
+from strapi_client.models.page_validation import validate_page
+
+NOW = '2024-01-01T00:00:00Z'
+TOTAL = 23
+
+
+class Article(SmartDocument):
+    __singular_api_id__ = 'article'
+    __plural_api_id__ = 'articles'
+    __content_type_id__ = 'api::article.article'
+
+    title: str
+
+
+def rows(start: int, limit: int) -> list[dict]:
+    return [
+        {'id': i, 'documentId': f'doc{i}', 'createdAt': NOW, 'updatedAt': NOW, 'publishedAt': NOW, 'title': f'T{i}'}
+        for i in range(start, min(start + limit, TOTAL))
+    ]
+
+
+def pages_transport(requests: list[dict]) -> httpx2.MockTransport:
+    def handler(request: httpx2.Request) -> httpx2.Response:
+        query = parse_qs(request.url.query.decode())
+        requests.append(query)
+        start = int(query['pagination[start]'][0])
+        limit = int(query['pagination[limit]'][0])
+        return httpx2.Response(
+            200,
+            json={'data': rows(start, limit), 'meta': {'pagination': {'start': start, 'limit': limit, 'total': TOTAL}}},
+        )
+
+    return httpx2.MockTransport(handler)
+
+
+def make_client(requests: list[dict]) -> StrapiClientAsync:
+    client = StrapiClientAsync(base_url='http://test/api', token='token')
+    client._client = httpx2.AsyncClient(transport=pages_transport(requests))
+    return client
+
+
+def test_iter_raw_pages_yields_pages_in_order():
+    requests: list[dict] = []
+
+    async def run():
+        return [page async for page in make_client(requests).iter_raw_pages('articles', batch_size=5, max_concurrency=3)]
+
+    pages = asyncio.run(run())
+    assert len(pages) == 5
+    assert [row['id'] for page in pages for row in json.loads(page)['data']] == list(range(TOTAL))
+    assert requests[0]['pagination[withCount]'] == ['true']
+
+
+def test_validate_page_returns_models_or_ndjson():
+    content = json.dumps({'data': rows(0, 2), 'meta': {}}).encode()
+    documents = validate_page(Article, content, 'models')
+    assert [document.title for document in documents] == ['T0', 'T1']
+    lines = validate_page(Article, content, 'ndjson').splitlines()
+    assert [json.loads(line)['documentId'] for line in lines] == ['doc0', 'doc1']
+
+
+def test_export_documents_in_process_pool():
+    async def run():
+        client = make_client([])
+        with ProcessPoolExecutor(2) as executor:
+            return [page async for page in Article.export_documents(client, executor, limit=5, max_pending_pages=2)]
+
+    pages = asyncio.run(run())
+    assert [len(page) for page in pages] == [5, 5, 5, 5, 3]
+    assert [document.id for page in pages for document in page] == list(range(TOTAL))
+    assert isinstance(pages[0][0], Article)
+
+
+def test_export_ndjson_in_thread_pool():
+    async def run():
+        client = make_client([])
+        with ThreadPoolExecutor(2) as executor:
+            return b''.join([page async for page in Article.export_ndjson(client, executor, limit=10)])
+
+    lines = asyncio.run(run()).splitlines()
+    assert [json.loads(line)['title'] for line in lines] == [f'T{i}' for i in range(TOTAL)]
@@ -0,0 +1,67 @@
+import asyncio
+import time
+
+import httpx2
+from strapi_client import RateLimit, StrapiClient, StrapiClientAsync
+from strapi_client.rate_limiter import RateLimiter, TokenBucket
+
+
+def test_token_bucket_reserves_tokens_in_order():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert 0.09 < bucket.reserve() <= 0.1
+    assert 0.19 < bucket.reserve() <= 0.2
+
+
+def test_rate_limiter_matches_longest_route_prefix():
+    limiter = RateLimiter(
+        RateLimit(max_in_flight=10),
+        {'items': RateLimit(max_in_flight=2), '/items/special': RateLimit(max_in_flight=1)},
+    )
+    assert limiter._match('items/1') == [None, 'items']
+    assert limiter._match('items/special/1') == [None, 'items/special']
+    assert limiter._match('upload') == [None]
+    assert limiter._match('items') == [None, 'items']
+
+
+def test_rate_limiter_does_not_match_sibling_route():
+    limiter = RateLimiter(None, {'upload': RateLimit(max_in_flight=1)})
+    assert limiter._match('upload/files') == ['upload']
+    assert limiter._match('uploads-archive/1') == []
+
+
+def test_sync_client_respects_request_rate():
+    transport = httpx2.MockTransport(lambda request: httpx2.Response(200, json={'data': {'id': 1}}))
+    rate_limit = RateLimit(requests_per_second=50, burst=1)
+    with StrapiClient(base_url='http://test', token='token', transport=transport, rate_limit=rate_limit) as c:
+        started_at = time.monotonic()
+        for _ in range(6):
+            c.get_document('items', '1')
+        assert time.monotonic() - started_at >= 0.09
+
+
+def test_async_client_respects_max_in_flight():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx2.Response(200, json={'data': {'id': 1}})
+
+    async def run():
+        async with StrapiClientAsync(
+            base_url='http://test',
+            token='token',
+            transport=httpx2.MockTransport(handler),
+            rate_limit=RateLimit(max_in_flight=5),
+            route_rate_limits={'items': RateLimit(max_in_flight=3)},
+        ) as c:
+            await asyncio.gather(*(c.get_document('items', str(i)) for i in range(20)))
+
+    asyncio.run(run())
+    assert max_in_flight == 3
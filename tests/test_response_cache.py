@@ -0,0 +1,238 @@
+import asyncio
+import gzip
+import json
+import time
+
+import httpx2
+from strapi_client import MemoryCache, StrapiClient, StrapiClientAsync
+from strapi_client.response_cache import CachedResponse
+
+
+def entry(content: bytes = b'{}', stored_at: float | None = None) -> CachedResponse:
+    return CachedResponse(status_code=200, headers={}, content=content, stored_at=stored_at or time.time())
+
+
+def counting_transport(calls: list):
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        return httpx2.Response(200, json={'data': {'id': len(calls)}})
+
+    return httpx2.MockTransport(handler)
+
+
+def test_memory_cache_evicts_least_recently_used_entries():
+    cache = MemoryCache(max_entries=2, max_bytes=10)
+    cache.set('a', entry(b'1234'))
+    cache.set('b', entry(b'1234'))
+    assert cache.get('a') is not None
+    cache.set('c', entry(b'1234'))
+    assert cache.get('b') is None and len(cache) == 2
+    cache.set('d', entry(b'123456'))
+    assert cache.get('a') is None and cache.get('c') is not None and cache.size == 10
+    cache.set('e', entry(b'x' * 11))
+    assert cache.get('e') is None
+
+
+def test_memory_cache_expires_and_invalidates_entries():
+    cache = MemoryCache(ttl=10, stale_while_revalidate=10)
+    cache.set('items?a=1', entry())
+    cache.set('items/1?', entry(stored_at=time.time() - 15))
+    cache.set('items-other?', entry(stored_at=time.time() - 25))
+    cache.set('users?', entry())
+    assert not cache.is_fresh(cache.get('items/1?'))
+    assert cache.get('items-other?') is None
+    cache.invalidate('items')
+    assert cache.get('items?a=1') is None and cache.get('items/1?') is None
+    assert cache.get('users?') is not None
+
+
+def test_client_serves_cached_responses_and_invalidates_on_write():
+    calls = []
+    with StrapiClient(
+        base_url='http://test', token='token', transport=counting_transport(calls), cache=MemoryCache()
+    ) as c:
+        assert c.get_document('items', '1', locale='en').data['id'] == 1
+        assert c.get_document('items', '1', locale='en').data['id'] == 1
+        assert c.get_document('items', '1', locale='de').data['id'] == 2
+        c.update_document('items', '1', {'title': 'a'})
+        assert c.get_document('items', '1', locale='en').data['id'] == 4
+        assert c.send_get_request('items/1', use_cache=False).json()['data']['id'] == 5
+    assert len(calls) == 5
+
+
+def test_client_revalidates_stale_responses_in_background():
+    calls = []
+    cache = MemoryCache(ttl=0, stale_while_revalidate=60)
+    with StrapiClient(base_url='http://test', token='token', transport=counting_transport(calls), cache=cache) as c:
+        assert c.get_document('items', '1').data['id'] == 1
+        assert c.get_document('items', '1').data['id'] == 1
+        for _ in range(100):
+            if len(calls) == 2 and not c._revalidating:
+                break
+            time.sleep(0.01)
+        assert c.get_document('items', '1').data['id'] == 2
+
+
+def test_async_client_revalidates_stale_responses_in_background():
+    calls = []
+
+    async def run():
+        cache = MemoryCache(ttl=0, stale_while_revalidate=60)
+        async with StrapiClientAsync(
+            base_url='http://test', token='token', transport=counting_transport(calls), cache=cache
+        ) as c:
+            first = await c.get_document('items', '1')
+            stale = await c.get_document('items', '1')
+            await asyncio.gather(*c._revalidation_tasks)
+            fresh = await c.get_document('items', '1')
+            await c.delete_document('items', '1')
+            return first.data['id'], stale.data['id'], fresh.data['id'], len(cache)
+
+    assert asyncio.run(run()) == (1, 1, 2, 0)
+
+
+def etag_transport(calls: list):
+    def handler(request):
+        calls.append(request.headers.get('If-None-Match'))
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx2.Response(304, headers={'ETag': '"v1"'})
+        return httpx2.Response(200, json={'data': {'id': len(calls)}}, headers={'ETag': '"v1"'})
+
+    return httpx2.MockTransport(handler)
+
+
+def test_memory_cache_keeps_expired_entries_with_validators():
+    cache = MemoryCache(ttl=10)
+    cache.set('items?', entry(stored_at=time.time() - 20))
+    expired = CachedResponse(status_code=200, headers={'etag': '"v1"'}, content=b'{}', stored_at=time.time() - 20)
+    cache.set('users?', expired)
+    assert cache.get('items?') is None
+    assert cache.get('users?').validation_headers == {'If-None-Match': '"v1"'}
+
+
+def test_client_revalidates_expired_responses_with_etag():
+    calls = []
+    with StrapiClient(
+        base_url='http://test', token='token', transport=etag_transport(calls), cache=MemoryCache(ttl=0)
+    ) as c:
+        assert c.get_document('items', '1').data['id'] == 1
+        assert c.get_document('items', '1').data['id'] == 1
+    assert calls == [None, '"v1"']
+
+
+def test_async_client_revalidates_expired_responses_with_etag():
+    calls = []
+
+    async def run():
+        async with StrapiClientAsync(
+            base_url='http://test', token='token', transport=etag_transport(calls), cache=MemoryCache(ttl=0)
+        ) as c:
+            first = await c.get_document('items', '1')
+            second = await c.get_document('items', '1')
+            return first.data['id'], second.data['id']
+
+    assert asyncio.run(run()) == (1, 1)
+    assert calls == [None, '"v1"']
+
+
+def test_cached_gzip_response_is_served_decoded():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        body = gzip.compress(json.dumps({'data': {'id': 1}}).encode())
+        return httpx2.Response(200, content=body, headers={'Content-Encoding': 'gzip', 'Content-Length': str(len(body))})
+
+    with StrapiClient(
+        base_url='http://test', token='token', transport=httpx2.MockTransport(handler), cache=MemoryCache()
+    ) as c:
+        assert c.get_document('items', '1').data['id'] == 1
+        assert c.get_document('items', '1').data['id'] == 1
+    assert len(calls) == 1
+
+
+def token_transport(calls: list):
+    def handler(request):
+        calls.append(request.headers['Authorization'])
+        return httpx2.Response(200, json={'data': {'user': request.headers['Authorization']}})
+
+    return httpx2.MockTransport(handler)
+
+
+def test_cache_separates_responses_of_different_tokens():
+    calls = []
+    cache = MemoryCache()
+    with StrapiClient(base_url='http://test', token='alice', transport=token_transport(calls), cache=cache) as alice, \
+            StrapiClient(base_url='http://test', token='bob', transport=token_transport(calls), cache=cache) as bob:
+        assert alice.get_document('items', '1').data['user'] == 'Bearer alice'
+        assert bob.get_document('items', '1').data['user'] == 'Bearer bob'
+        assert alice.get_document('items', '1').data['user'] == 'Bearer alice'
+    assert len(calls) == 2
+    assert not any('alice' in key or 'bob' in key for key in cache._entries)
+
+
+
+def slow_first_read_handler(state: dict, started, release):
+    def handler(request):
+        if request.method == 'PUT':
+            state['v'] = json.loads(request.content)['data']['v']
+            return httpx2.Response(200, json={'data': {'v': state['v']}})
+        value = state['v']
+        state['gets'] += 1
+        if state['gets'] == 1:  # First read is slow and finishes after the write
+            started.set()
+            release.wait(1)
+        return httpx2.Response(200, json={'data': {'v': value}})
+
+    return handler
+
+
+def test_response_sent_before_write_is_not_cached_after_it():
+    from concurrent.futures import ThreadPoolExecutor
+    import threading
+
+    state = {'v': 1, 'gets': 0}
+    started, release = threading.Event(), threading.Event()
+    transport = httpx2.MockTransport(slow_first_read_handler(state, started, release))
+    with StrapiClient(base_url='http://test', token='token', transport=transport, cache=MemoryCache(ttl=60)) as c:
+        with ThreadPoolExecutor(1) as executor:
+            early = executor.submit(c.get_document, 'items', '1')
+            assert started.wait(1)
+            c.update_document('items', '1', {'v': 2})
+            release.set()
+            assert early.result().data['v'] == 1
+        assert c.get_document('items', '1').data['v'] == 2
+        invalidation_count = c._invalidation_count
+        c.update_document('other', '1', {'v': 3})
+        c._set_cache_entry('items/1?#x', entry(), invalidation_count)
+        assert c.cache.get('items/1?#x') is not None
+
+
+def test_async_response_sent_before_write_is_not_cached_after_it():
+    state = {'v': 1, 'gets': 0}
+
+    async def run():
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def handler(request):
+            if request.method == 'PUT':
+                state['v'] = json.loads(request.content)['data']['v']
+                return httpx2.Response(200, json={'data': {'v': state['v']}})
+            value = state['v']
+            state['gets'] += 1
+            if state['gets'] == 1:
+                started.set()
+                await release.wait()
+            return httpx2.Response(200, json={'data': {'v': value}})
+
+        async with StrapiClientAsync(
+            base_url='http://test', token='token', transport=httpx2.MockTransport(handler), cache=MemoryCache(ttl=60)
+        ) as c:
+            early = asyncio.ensure_future(c.get_document('items', '1'))
+            await started.wait()
+            await c.update_document('items', '1', {'v': 2})
+            release.set()
+            assert (await early).data['v'] == 1
+            assert (await c.get_document('items', '1')).data['v'] == 2
+
+    asyncio.run(run())
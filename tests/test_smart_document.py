@@ -8,6 +8,7 @@ from io import BytesIO
 from unittest.mock import patch, AsyncMock, MagicMock
 from strapi_client import StrapiClientAsync, SmartDocument
 from strapi_client.models.base_document import BaseDocument
+from strapi_client.models.query_plan import QueryPlan
 from strapi_client.utils import hash_model
 
 
@@ -137,6 +138,13 @@ def test_get_documents(async_client):
     asyncio.run(main())
 
 
+def test_iter_documents(async_client):
+    async def main():
+        docs = [doc async for doc in TodoItem.iter_documents(async_client)]
+        assert [doc.name for doc in docs] == ['First']
+    asyncio.run(main())
+
+
 def test_get_documents_with_meta(async_client):
     async def main():
         docs, meta = await TodoItem.get_documents_with_meta(async_client)
@@ -622,13 +630,10 @@ def test_get_first_document(async_client):
 def test_create_document_with_populate(async_client):
     """Test create_document with populate=True path."""
     async def main():
-        # Mock the get_model_fields_and_population to return a non-empty populate
-        with patch('strapi_client.models.smart_document.get_model_fields_and_population') as mock_get:
-            # First call for create_document, second for get_document
-            mock_get.side_effect = [
-                (None, {"nested": True}),  # Return non-empty populate
-                (None, {"nested": True})   # For the subsequent get_document call
-            ]
+        # Mock the get_query_plan to return a non-empty populate
+        with patch('strapi_client.models.smart_document.get_query_plan') as mock_get:
+            # Used both by create_document and by the subsequent get_document call
+            mock_get.return_value = QueryPlan.build([], {"nested": True})  # Return non-empty populate
             
             # Create a document
             item = await TodoItem.create_document(async_client, {"name": "New"})
@@ -657,8 +662,8 @@ def test_update_document(async_client):
         )
         
         # Test update without populate
-        with patch('strapi_client.models.smart_document.get_model_fields_and_population') as mock_get:
-            mock_get.return_value = (None, None)  # Empty populate
+        with patch('strapi_client.models.smart_document.get_query_plan') as mock_get:
+            mock_get.return_value = QueryPlan.build([], {})  # Empty populate
             
             # Mock the response to include the updated name
             with patch.object(async_client, 'update_document') as mock_update:
@@ -680,8 +685,8 @@ def test_update_document(async_client):
                 assert updated.name == "Updated"
         
         # Test update with populate
-        with patch('strapi_client.models.smart_document.get_model_fields_and_population') as mock_get:
-            mock_get.return_value = (None, {"nested": True})  # Non-empty populate
+        with patch('strapi_client.models.smart_document.get_query_plan') as mock_get:
+            mock_get.return_value = QueryPlan.build([], {"nested": True})  # Non-empty populate
             
             # Mock refresh_document on the SmartDocument class
             with patch('strapi_client.models.smart_document.SmartDocument.refresh_document') as mock_refresh:
@@ -948,3 +953,69 @@ def test_upload_file():
             mock_refresh.assert_called_once()
             
     asyncio.run(main())
+
+
+def test_load_document(async_client):
+    async def main():
+        with patch.object(async_client.loader, 'load', AsyncMock(return_value=None)) as load:
+            assert await TodoItem.load_document(async_client, 'missing') is None
+        assert load.call_args.args == ('todo-items', 'missing')
+    asyncio.run(main())
+
+
+def test_documents_are_validated_directly_from_json():
+    content = json.dumps([
+        {'id': i, 'documentId': str(i), 'createdAt': NOW, 'updatedAt': NOW, 'publishedAt': NOW, 'name': f'Item {i}'}
+        for i in range(3)
+    ]).encode()
+    docs = TodoItem.from_list_json(content)
+    assert [doc.name for doc in docs] == ['Item 0', 'Item 1', 'Item 2']
+    assert all(isinstance(doc, TodoItem) for doc in docs)
+    with pytest.raises(ValueError):
+        TodoItem.from_list_json(b'[{"id": 1}]')
+
+
+def test_reads_skip_intermediate_dict_responses(async_client):
+    from strapi_client.models.response import DocumentResponse, DocumentsResponse
+
+    async def main():
+        with (
+            patch.object(DocumentsResponse, 'model_validate_json', side_effect=AssertionError('parsed to dicts')),
+            patch.object(DocumentResponse, 'model_validate_json', side_effect=AssertionError('parsed to dicts')),
+        ):
+            docs = await TodoItem.get_documents(async_client)
+            keyset_docs = await TodoItem.get_documents(async_client, pagination_mode='keyset')
+            iterated = [doc async for doc in TodoItem.iter_documents(async_client, pagination_mode='count_free')]
+            docs_with_meta, meta = await TodoItem.get_documents_with_meta(async_client)
+            first = await TodoItem.get_first_document(async_client)
+            doc = await TodoItem.get_document(async_client, '1')
+        assert docs == keyset_docs == iterated == docs_with_meta == [first] == [doc]
+        assert isinstance(doc, TodoItem) and doc.name == 'First' and meta.pagination.total == 1
+    asyncio.run(main())
+
+
+def test_keyset_value_of_typed_page():
+    from strapi_client.models.page_validation import get_documents_response_type
+
+    page = get_documents_response_type(TodoItem).model_validate_json(json.dumps({
+        'data': [{'id': 7, 'documentId': 'd7', 'createdAt': NOW, 'updatedAt': NOW, 'publishedAt': NOW, 'name': 'x'}],
+        'meta': {'pagination': {}},
+    }))
+    assert StrapiClientAsync._get_keyset_value(page, 'documentId') == 'd7'
+    assert StrapiClientAsync._get_keyset_value(page, 'createdAt') == page.data[0].created_at.isoformat()
+
+
+def test_get_documents_with_cooperative_validation():
+    from strapi_client import CooperativeValidation
+
+    async def main():
+        async with StrapiClientAsync(
+            base_url='http://test', token='token', transport=httpx2.MockTransport(mock_strapi_handler),
+            cooperative_validation=CooperativeValidation(max_time_slice=0.001),
+        ) as client:
+            with patch.object(TodoItem, 'afrom_list_response', wraps=TodoItem.afrom_list_response) as afrom:
+                docs = await TodoItem.get_documents(client)
+                docs_with_meta, _ = await TodoItem.get_documents_with_meta(client)
+            assert afrom.call_count == 2
+            assert docs[0].name == 'First' and docs == docs_with_meta
+    asyncio.run(main())
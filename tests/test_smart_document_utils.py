@@ -18,8 +18,13 @@ from strapi_client.models.smart_document_utils import (
     is_base_component,
     get_model_data,
     PopulateStructureBuilder,
-    get_model_fields_and_population
+    get_model_fields_and_population,
+    get_query_plan,
+    invalidate_query_plans,
+    may_hold_document
 )
+from typing import Any, Literal
+from strapi_client.models.api_parameters import ApiParameters
 from pydantic import BaseModel, Field
 
 
@@ -423,3 +428,76 @@ class TestPublicAPI:
         data_json = get_model_data(doc, json_mode=True)
         assert data_json["id"] == 1
         assert data_json["name"] == "Test Document"
+
+
+class TestQueryPlan:
+    """Tests for cached query plans."""
+
+    def test_get_query_plan_is_cached(self):
+        """Test that query plan is computed once per class."""
+        plan = get_query_plan(MockDocument)
+        assert get_query_plan(MockDocument) is plan
+        assert (plan.fields, plan.populate) == get_model_fields_and_population(MockDocument)
+
+    def test_invalidate_query_plans(self):
+        """Test that invalidated plans are computed again."""
+        plan = get_query_plan(MockDocument)
+        invalidate_query_plans(MockDocument)
+        assert get_query_plan(MockDocument) is not plan
+        plan = get_query_plan(MockDocument)
+        invalidate_query_plans()
+        assert get_query_plan(MockDocument) is not plan
+
+    def test_encoded_query_matches_parameters(self):
+        """Test that parameters with query plan are encoded the same way as with fields and populate."""
+        plan = get_query_plan(MockDocument)
+        params = ApiParameters(
+            sort=["id"], filters={"name": {"$eq": "a"}}, start=0, limit=10, locale="en"
+        )
+        expected = params.model_copy(update={"fields": plan.fields, "populate": plan.populate}).stringify()
+        assert params.with_query_plan(plan).stringify() == expected
+        assert plan.encoded_query in expected
+
+
+class TestModelDataSerializer:
+    """Tests for per-class serializer of get_model_data."""
+
+    def test_may_hold_document(self):
+        """Test detection of fields which values may be documents."""
+        assert may_hold_document(MockNestedDocument) is True
+        assert may_hold_document(Optional[List[MockNestedDocument]]) is True
+        assert may_hold_document(Any) is True
+        assert may_hold_document(list) is True
+        assert may_hold_document(str) is False
+        assert may_hold_document(Optional[datetime]) is False
+        assert may_hold_document(list[int] | None) is False
+        assert may_hold_document(Literal["a", "b"]) is False
+
+    def test_relation_in_untyped_field(self):
+        """Test that documents in fields annotated with Any are replaced with their IDs."""
+
+        class AnyDocument(BaseDocument):
+            payload: Any = None
+            tags: list[str] = []
+
+        related = MockNestedDocument(
+            id=7,
+            documentId="7",
+            createdAt=datetime(2024, 1, 1),
+            updatedAt=datetime(2024, 1, 1),
+            publishedAt=datetime(2024, 1, 1),
+            title="Related"
+        )
+        doc = AnyDocument(
+            id=1,
+            documentId="1",
+            createdAt=datetime(2024, 1, 1),
+            updatedAt=datetime(2024, 1, 1),
+            publishedAt=datetime(2024, 1, 1),
+            payload=[related],
+            tags=["a"]
+        )
+        data = get_model_data(doc)
+        assert data["payload"] == [7]
+        assert data["tags"] == ["a"]
+
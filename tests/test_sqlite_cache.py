@@ -0,0 +1,141 @@
+import sqlite3
+import time
+
+import httpx2
+from strapi_client import SQLiteCache, StrapiClient
+from strapi_client.response_cache import CachedResponse
+
+
+def entry(content: bytes, stored_at: float | None = None) -> CachedResponse:
+    return CachedResponse(
+        status_code=200, headers={'etag': '"1"'}, content=content, stored_at=stored_at or time.time()
+    )
+
+
+def test_sqlite_cache_persists_entries(tmp_path):
+    cache = SQLiteCache(tmp_path / 'cache.db', compress=True)
+    cache.set('items?', entry(b'{"data": []}' * 100))
+    assert cache.size < 1200
+    cache.close()
+    cache = SQLiteCache(tmp_path / 'cache.db', compress=True)
+    restored = cache.get('items?')
+    assert restored.content == b'{"data": []}' * 100
+    assert restored.headers == {'etag': '"1"'}
+    cache.close()
+
+
+def test_sqlite_cache_expires_evicts_and_invalidates(tmp_path):
+    cache = SQLiteCache(tmp_path / 'cache.db', ttl=10, max_bytes=10)
+    cache.set('old?', entry(b'1', stored_at=time.time() - 20).model_copy(update={'headers': {}}))
+    assert cache.get('old?') is None
+    cache.set('validated?', entry(b'1', stored_at=time.time() - 20))
+    assert cache.get('validated?') is not None
+    cache.invalidate('validated')
+    cache.set('a?', entry(b'1234'))
+    cache.set('b?', entry(b'1234'))
+    assert cache.get('a?') is not None
+    cache.set('c?', entry(b'1234'))
+    assert cache.get('b?') is None and len(cache) == 2
+    cache.set('items/1?', entry(b'1'))
+    cache.invalidate('items')
+    assert cache.get('items/1?') is None and cache.get('a?') is not None
+    cache.clear()
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_sqlite_cache_tracks_total_size_incrementally(tmp_path):
+    path = tmp_path / 'cache.db'
+    cache = SQLiteCache(path, max_bytes=100)
+    cache.set('a?', entry(b'1' * 30))
+    cache.set('a?', entry(b'1' * 20))
+    cache.set('b?', entry(b'1' * 40))
+    assert cache.size == 60
+    other_process = SQLiteCache(path, max_bytes=100)
+    other_process.set('c?', entry(b'1' * 30))
+    assert cache.size == other_process.size == 90
+    cache.invalidate('b')
+    assert other_process.size == 50
+    cache.set('d?', entry(b'1' * 60))
+    assert cache.size == 90 and cache.get('a?') is None and cache.get('c?') is not None
+    cache.clear()
+    assert other_process.size == 0
+    cache.close()
+    other_process.close()
+
+
+def test_client_serves_responses_from_disk_after_restart(tmp_path):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx2.Response(200, json={'data': {'id': 1}})
+
+    for _ in range(2):
+        cache = SQLiteCache(tmp_path / 'cache.db')
+        with StrapiClient(
+            base_url='http://test', token='token', transport=httpx2.MockTransport(handler), cache=cache
+        ) as c:
+            assert c.get_document('items', '1').data['id'] == 1
+        cache.close()
+    assert len(calls) == 1
+
+
+def test_clients_with_different_tokens_share_database_file(tmp_path):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx2.Response(200, json={'data': {'user': request.headers['Authorization']}})
+
+    for token in ('alice', 'bob', 'alice', 'bob'):
+        cache = SQLiteCache(tmp_path / 'cache.db')
+        with StrapiClient(
+            base_url='http://test', token=token, transport=httpx2.MockTransport(handler), cache=cache
+        ) as c:
+            assert c.get_document('items', '1').data['user'] == f'Bearer {token}'
+        cache.close()
+    assert len(calls) == 2
+    with sqlite3.connect(tmp_path / 'cache.db') as connection:
+        keys = [key for (key,) in connection.execute('SELECT key FROM responses')]
+    assert len(keys) == 2 and not any('alice' in key or 'bob' in key for key in keys)
+
+
+
+def test_async_client_calls_sqlite_cache_in_worker_threads(tmp_path):
+    import asyncio
+    import threading
+    from unittest.mock import patch
+
+    from strapi_client import StrapiClientAsync
+
+    threads = set()
+
+    def record(method):
+        def call(self, *args):
+            threads.add(threading.get_ident())
+            return method(self, *args)
+
+        return call
+
+    def handler(request):
+        return httpx2.Response(200, json={'data': {'id': 1}})
+
+    async def run():
+        cache = SQLiteCache(tmp_path / 'cache.db')
+        async with StrapiClientAsync(
+            base_url='http://test', token='token', transport=httpx2.MockTransport(handler), cache=cache
+        ) as c:
+            await c.get_document('items', '1')
+            await c.get_document('items', '1')
+            await c.delete_document('items', '1')
+        cache.close()
+        return threading.get_ident()
+
+    with (
+        patch.object(SQLiteCache, 'get', record(SQLiteCache.get)),
+        patch.object(SQLiteCache, 'set', record(SQLiteCache.set)),
+        patch.object(SQLiteCache, 'invalidate', record(SQLiteCache.invalidate)),
+    ):
+        loop_thread = asyncio.run(run())
+    assert threads and loop_thread not in threads
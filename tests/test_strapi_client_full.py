@@ -2,7 +2,7 @@ import asyncio
 import json
 import pytest
 import httpx2
-from strapi_client import StrapiClient, StrapiClientAsync
+from strapi_client import RetryPolicy, StrapiClient, StrapiClientAsync
 from strapi_client.models.file_payload import FilePayload
 from strapi_client.strapi_client_base import StrapiClientBase
 
@@ -158,3 +158,420 @@ def test_async_check_health_does_not_hide_unexpected_errors(monkeypatch):
 
 
 
+def paginated_handler(total: int, failing_start: int | None = None):
+    def handler(request: httpx2.Request) -> httpx2.Response:
+        start = int(request.url.params.get('pagination[start]', 0))
+        limit = int(request.url.params.get('pagination[limit]', 25))
+        if start == failing_start:
+            return httpx2.Response(500)
+        after = request.url.params.get('filters[id][$gt]') or request.url.params.get('filters[$and][1][id][$gt]')
+        if after is not None:
+            assert start == 0 and request.url.params.get('sort[0]') == 'id:asc'
+            start = int(after) + 1
+        data = [{'id': i} for i in range(start, min(start + limit, total))]
+        pagination = {'start': start, 'limit': limit}
+        if request.url.params.get('pagination[withCount]') == 'true':
+            pagination['total'] = total
+        return httpx2.Response(200, json={'data': data, 'meta': {'pagination': pagination}})
+
+    return handler
+
+
+def test_async_get_documents_concurrent_keeps_offset_order():
+    async def run():
+        async with StrapiClientAsync(base_url='http://test', token='token') as c:
+            c._client = httpx2.AsyncClient(transport=httpx2.MockTransport(paginated_handler(103)))
+            return await c.get_documents('items', batch_size=10, max_concurrency=4)
+
+    res = asyncio.run(run())
+    assert [d['id'] for d in res.data] == list(range(103))
+
+
+def test_async_get_documents_concurrent_propagates_error():
+    async def run():
+        async with StrapiClientAsync(base_url='http://test', token='token') as c:
+            c._client = httpx2.AsyncClient(transport=httpx2.MockTransport(paginated_handler(100, failing_start=50)))
+            return await c.get_documents('items', batch_size=10, max_concurrency=4)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+
+
+def test_get_documents_thread_pool_keeps_offset_order():
+    c = StrapiClient(base_url='http://test', token='token')
+    c._client = httpx2.Client(transport=httpx2.MockTransport(paginated_handler(103)))
+    res = c.get_documents('items', batch_size=10, max_concurrency=4)
+    assert [d['id'] for d in res.data] == list(range(103))
+
+
+def test_get_documents_thread_pool_reports_failed_offset():
+    c = StrapiClient(base_url='http://test', token='token')
+    c._client = httpx2.Client(transport=httpx2.MockTransport(paginated_handler(100, failing_start=50)))
+    with pytest.raises(RuntimeError, match="offset 50"):
+        c.get_documents('items', batch_size=10, max_concurrency=4)
+
+
+def test_iter_pages_and_documents():
+    c = StrapiClient(base_url='http://test', token='token')
+    c._client = httpx2.Client(transport=httpx2.MockTransport(paginated_handler(45)))
+    assert [len(p.data) for p in c.iter_pages('items', batch_size=10)] == [10, 10, 10, 10, 5]
+    ids = [d['id'] for d in c.iter_documents('items', batch_size=10, max_concurrency=3)]
+    assert ids == list(range(45))
+
+
+def test_async_iter_documents_with_read_ahead():
+    async def run():
+        async with StrapiClientAsync(base_url='http://test', token='token') as c:
+            c._client = httpx2.AsyncClient(transport=httpx2.MockTransport(paginated_handler(45)))
+            return [d['id'] async for d in c.iter_documents('items', batch_size=10, max_concurrency=3)]
+
+    assert asyncio.run(run()) == list(range(45))
+
+
+def test_get_documents_keyset_mode():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return paginated_handler(30)(request)
+
+    c = StrapiClient(base_url='http://test', token='token')
+    c._client = httpx2.Client(transport=httpx2.MockTransport(handler))
+    res = c.get_documents('items', filters={'title': {'$null': False}}, batch_size=10, pagination_mode='keyset')
+    assert [d['id'] for d in res.data] == list(range(30))
+    assert len(requests) == 4
+    assert all(r.url.params.get('pagination[withCount]') == 'false' for r in requests)
+
+
+def test_async_get_documents_keyset_mode():
+    async def run():
+        async with StrapiClientAsync(base_url='http://test', token='token') as c:
+            c._client = httpx2.AsyncClient(transport=httpx2.MockTransport(paginated_handler(25)))
+            return await c.get_documents('items', batch_size=10, pagination_mode='keyset')
+
+    assert [d['id'] for d in asyncio.run(run()).data] == list(range(25))
+
+
+def test_keyset_mode_rejects_concurrency():
+    c = StrapiClient(base_url='http://test', token='token')
+    with pytest.raises(ValueError):
+        c.get_documents('items', pagination_mode='keyset', max_concurrency=2)
+
+
+@pytest.mark.parametrize('total', [0, 30, 35])
+@pytest.mark.parametrize('max_concurrency', [1, 3])
+def test_get_documents_count_free_mode(total, max_concurrency):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return paginated_handler(total)(request)
+
+    c = StrapiClient(base_url='http://test', token='token')
+    c._client = httpx2.Client(transport=httpx2.MockTransport(handler))
+    res = c.get_documents('items', batch_size=10, pagination_mode='count_free', max_concurrency=max_concurrency)
+    assert [d['id'] for d in res.data] == list(range(total))
+    assert res.meta.pagination.total is None
+    assert all(r.url.params.get('pagination[withCount]') == 'false' for r in requests)
+
+
+def test_async_get_documents_count_free_mode():
+    async def run():
+        async with StrapiClientAsync(base_url='http://test', token='token') as c:
+            c._client = httpx2.AsyncClient(transport=httpx2.MockTransport(paginated_handler(35)))
+            return await c.get_documents('items', batch_size=10, pagination_mode='count_free', max_concurrency=3)
+
+    assert [d['id'] for d in asyncio.run(run()).data] == list(range(35))
+
+
+def test_count_free_mode_detects_clamped_limit():
+    def handler(request):
+        return httpx2.Response(200, json={'data': [{'id': 1}], 'meta': {'pagination': {'start': 0, 'limit': 1}}})
+
+    c = StrapiClient(base_url='http://test', token='token')
+    c._client = httpx2.Client(transport=httpx2.MockTransport(handler))
+    with pytest.raises(RuntimeError, match="limited by server"):
+        c.get_documents('items', batch_size=10, pagination_mode='count_free')
+
+
+@pytest.mark.parametrize('pagination_mode', ['offset', 'keyset', 'count_free'])
+def test_get_documents_adaptive_batch_size(pagination_mode):
+    limits = []
+
+    def handler(request):
+        limit = int(request.url.params['pagination[limit]'])
+        limits.append(limit)
+        # Emulate server maxLimit of 40
+        params = dict(request.url.params)
+        params['pagination[limit]'] = str(min(limit, 40))
+        return paginated_handler(500)(httpx2.Request('GET', request.url.copy_with(params=params)))
+
+    c = StrapiClient(base_url='http://test', token='token')
+    c._client = httpx2.Client(transport=httpx2.MockTransport(handler))
+    res = c.get_documents('items', batch_size='auto', pagination_mode=pagination_mode)
+    assert [d['id'] for d in res.data] == list(range(500))
+    assert max(limits) > 25 and limits[-1] <= 40
+
+
+def test_adaptive_batch_size_rejects_concurrency_and_specific_page():
+    c = StrapiClient(base_url='http://test', token='token')
+    with pytest.raises(ValueError):
+        c.get_documents('items', batch_size='auto', max_concurrency=2)
+    with pytest.raises(ValueError):
+        c.get_documents('items', batch_size='auto', start=0)
+
+
+def test_client_uses_transport_configuration(mock_transport):
+    limits = httpx2.Limits(max_connections=8, keepalive_expiry=30.0)
+    with StrapiClient(base_url='http://test', token='token', transport=mock_transport, limits=limits) as c:
+        assert c.get_document('items', '1').data['id'] == 1
+        assert c.client._transport is mock_transport
+
+
+def test_async_client_uses_transport_configuration():
+    async def run():
+        transport = httpx2.MockTransport(paginated_handler(5))
+        async with StrapiClientAsync(base_url='http://test', token='token', transport=transport) as c:
+            return await c.get_documents('items')
+
+    assert len(asyncio.run(run()).data) == 5
+
+
+def flaky_transport(failures: list, calls: list):
+    def handler(request):
+        calls.append(request.method)
+        if failures:
+            failure = failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        return httpx2.Response(200, json={'data': {'id': 1}})
+
+    return httpx2.MockTransport(handler)
+
+
+def test_retry_policy_retries_idempotent_requests():
+    calls = []
+    failures = [
+        httpx2.Response(503),
+        httpx2.ConnectError('connection refused'),
+        httpx2.Response(429, headers={'Retry-After': '0'}),
+    ]
+    c = StrapiClient(
+        base_url='http://test',
+        token='token',
+        transport=flaky_transport(failures, calls),
+        retry_policy=RetryPolicy(backoff_factor=0),
+    )
+    with c:
+        assert c.get_document('items', '1').data['id'] == 1
+    assert calls == ['GET'] * 4
+
+
+def test_retry_policy_does_not_retry_post_or_exceed_max_retries():
+    calls = []
+    c = StrapiClient(
+        base_url='http://test',
+        token='token',
+        transport=flaky_transport([httpx2.Response(503)] * 5, calls),
+        retry_policy=RetryPolicy(max_retries=2, backoff_factor=0),
+    )
+    with c:
+        with pytest.raises(RuntimeError, match="503"):
+            c.create_document('items', {'title': 'a'})
+        assert calls == ['POST']
+        with pytest.raises(RuntimeError, match="503"):
+            c.get_document('items', '1')
+        assert calls == ['POST'] + ['GET'] * 3
+
+
+def test_async_retry_policy_retries_pages():
+    calls = []
+    failures = [httpx2.Response(502)]
+
+    def handler(request):
+        calls.append(request.url.params.get('pagination[start]'))
+        if request.url.params.get('pagination[start]') == '10' and failures:
+            return failures.pop(0)
+        return paginated_handler(25)(request)
+
+    async def run():
+        async with StrapiClientAsync(
+            base_url='http://test',
+            token='token',
+            transport=httpx2.MockTransport(handler),
+            retry_policy=RetryPolicy(backoff_factor=0),
+        ) as c:
+            return await c.get_documents('items', batch_size=10)
+
+    assert len(asyncio.run(run()).data) == 25
+    assert calls == ['0', '10', '10', '20']
+
+
+def test_retry_policy_delay():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+    assert policy.get_delay('GET', 0, httpx2.Response(503)) == 1
+    assert policy.get_delay('GET', 2, httpx2.Response(503)) == 4
+    assert policy.get_delay('GET', 2, httpx2.Response(404)) is None
+    assert policy.get_delay('POST', 0, httpx2.Response(503)) is None
+    assert policy.get_delay('GET', 1, httpx2.Response(429, headers={'Retry-After': '7'})) == 7
+    retry_at = 'Wed, 21 Oct 2015 07:28:00 GMT'
+    assert policy.get_delay('GET', 1, httpx2.Response(429, headers={'Retry-After': retry_at})) == 0
+    assert policy.get_delay('GET', 3, httpx2.Response(503)) is None
+    capped = RetryPolicy(max_retry_after=60)
+    assert capped.get_delay('GET', 0, httpx2.Response(503, headers={'Retry-After': '86400'})) == 60
+
+
+def test_concurrent_identical_get_requests_are_coalesced():
+    from concurrent.futures import ThreadPoolExecutor
+    import time
+
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        time.sleep(0.2)
+        return httpx2.Response(200, json={'data': {'id': len(calls)}})
+
+    with StrapiClient(base_url='http://test', token='token', transport=httpx2.MockTransport(handler)) as c:
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda _: c.get_document('items', '1').data['id'], range(8)))
+        assert c.get_document('items', '1').data['id'] == 2
+    assert results == [1] * 8
+    assert not c._in_flight
+
+
+def test_async_concurrent_identical_get_requests_are_coalesced():
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        await asyncio.sleep(0.01)
+        if request.url.path == '/api/items/2':
+            return httpx2.Response(500)
+        return httpx2.Response(200, json={'data': {'id': int(request.url.path[-1])}})
+
+    async def run():
+        async with StrapiClientAsync(
+            base_url='http://test', token='token', transport=httpx2.MockTransport(handler)
+        ) as c:
+            tasks = [asyncio.ensure_future(c.get_document('items', '1')) for _ in range(10)]
+            tasks[0].cancel()
+            results = await asyncio.gather(*tasks[1:], c.get_document('items', '3'))
+            errors = await asyncio.gather(*(c.get_document('items', '2') for _ in range(3)), return_exceptions=True)
+            assert all(isinstance(e, RuntimeError) for e in errors)
+            assert not c._in_flight
+            return [res.data['id'] for res in results]
+
+    assert asyncio.run(run()) == [1] * 9 + [3]
+    assert calls == ['/api/items/1', '/api/items/3', '/api/items/2']
+
+
+def read_after_write_handler(state: dict, started, release):
+    def handler(request):
+        if request.method == 'PUT':
+            state['v'] = json.loads(request.content)['data']['v']
+            return httpx2.Response(200, json={'data': {'v': state['v']}})
+        value = state['v']
+        state['gets'] += 1
+        if state['gets'] == 1:  # First read is slow and finishes after the write
+            started.set()
+            release.wait(1)
+        return httpx2.Response(200, json={'data': {'v': value}})
+
+    return handler
+
+
+def test_get_after_write_does_not_join_request_sent_before_write():
+    from concurrent.futures import ThreadPoolExecutor
+    import threading
+
+    state = {'v': 1, 'gets': 0}
+    started, release = threading.Event(), threading.Event()
+    transport = httpx2.MockTransport(read_after_write_handler(state, started, release))
+    with StrapiClient(base_url='http://test', token='token', transport=transport) as c:
+        with ThreadPoolExecutor(1) as executor:
+            early = executor.submit(c.get_document, 'items', '1')
+            assert started.wait(1)
+            c.update_document('items', '1', {'v': 2})
+            assert c.get_document('items', '1').data['v'] == 2
+            release.set()
+            assert early.result().data['v'] == 1
+    assert not c._in_flight
+
+
+def test_async_get_after_write_does_not_join_request_sent_before_write():
+    state = {'v': 1, 'gets': 0}
+
+    async def run():
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def handler(request):
+            if request.method == 'PUT':
+                state['v'] = json.loads(request.content)['data']['v']
+                return httpx2.Response(200, json={'data': {'v': state['v']}})
+            value = state['v']
+            state['gets'] += 1
+            if state['gets'] == 1:
+                started.set()
+                await release.wait()
+            return httpx2.Response(200, json={'data': {'v': value}})
+
+        async with StrapiClientAsync(
+            base_url='http://test', token='token', transport=httpx2.MockTransport(handler)
+        ) as c:
+            early = asyncio.ensure_future(c.get_document('items', '1'))
+            await started.wait()
+            await c.update_document('items', '1', {'v': 2})
+            assert (await asyncio.wait_for(c.get_document('items', '1'), 1)).data['v'] == 2
+            release.set()
+            assert (await early).data['v'] == 1
+            assert not c._in_flight
+
+    asyncio.run(run())
+
+
+def bulk_transport(calls: list):
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        if request.url.path.endswith('/bad') or b'"bad"' in request.content:
+            return httpx2.Response(400, json={'error': 'bad'})
+        if request.method == 'DELETE':
+            return httpx2.Response(204)
+        body = json.loads(request.content)
+        document_id = request.url.path.rsplit('/', 1)[-1] if request.method == 'PUT' else body['data']['name']
+        return httpx2.Response(200, json={'data': {'documentId': document_id, **body['data']}})
+
+    return httpx2.MockTransport(handler)
+
+
+def test_bulk_operations_report_partial_failures():
+    calls = []
+    with StrapiClient(base_url='http://test', token='token', transport=bulk_transport(calls)) as c:
+        created = c.create_documents('items', [{'name': 'a'}, {'name': 'bad'}, {'name': 'c'}], max_concurrency=2)
+        updated = c.update_documents('items', {'a': {'name': 'x'}, 'bad': {'name': 'y'}})
+        deleted = c.delete_documents('items', ['a', 'c'])
+        with pytest.raises(ValueError):
+            c.delete_documents('items', ['a'], max_concurrency=0)
+    assert [item.document_id for item in created.items] == ['a', None, 'c']
+    assert [item.index for item in created.failed] == [1] and 'Unable to send POST request' in created.failed[0].error
+    assert created.succeeded[1].response.data['name'] == 'c' and not created.success
+    assert [item.success for item in updated.items] == [True, False]
+    assert deleted.success and [item.document_id for item in deleted.items] == ['a', 'c']
+    assert len(calls) == 7
+
+
+def test_async_bulk_operations_report_partial_failures():
+    calls = []
+
+    async def run():
+        async with StrapiClientAsync(base_url='http://test', token='token', transport=bulk_transport(calls)) as c:
+            created = await c.create_documents('items', [{'name': str(i)} for i in range(20)], max_concurrency=3)
+            updated = await c.update_documents('items', {'1': {'name': 'x'}, '2': {'name': 'bad'}})
+            deleted = await c.delete_documents('items', ['1', 'bad', '3'])
+            return created, updated, deleted
+
+    created, updated, deleted = asyncio.run(run())
+    assert [item.document_id for item in created.items] == [str(i) for i in range(20)] and created.success
+    assert [item.success for item in updated.items] == [True, False]
+    assert [item.document_id for item in deleted.failed] == ['bad']